@@ -1,8 +1,8 @@
 """Support for IPMA weather service."""
+import asyncio
 import logging
 from datetime import timedelta
 
-import async_timeout
 import voluptuous as vol
 
 from homeassistant.components.weather import (
@@ -40,6 +40,12 @@ CONDITION_CLASSES = {
     'exceptional': [],
 }
 
+ID_TO_CONDITION = {
+    weather_type: condition
+    for condition, weather_types in CONDITION_CLASSES.items()
+    for weather_type in weather_types
+}
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Optional(CONF_NAME): cv.string,
     vol.Optional(CONF_LATITUDE): cv.latitude,
@@ -82,9 +88,8 @@ async def async_get_station(hass, latitude, longitude):
     from pyipma import Station
 
     websession = async_get_clientsession(hass)
-    with async_timeout.timeout(10):
-        station = await Station.get(websession, float(latitude),
-                                    float(longitude))
+    station = await asyncio.wait_for(
+        Station.get(websession, float(latitude), float(longitude)), 10)
 
     _LOGGER.debug("Initializing for coordinates %s, %s -> station %s",
                   latitude, longitude, station.local)
@@ -99,29 +104,40 @@ class IPMAWeather(WeatherEntity):
         """Initialise the platform with a data instance and station name."""
         self._station_name = config.get(CONF_NAME, station.local)
         self._station = station
+        self._unique_id = '{}, {}'.format(station.latitude, station.longitude)
         self._condition = None
         self._forecast = None
+        self._forecast_data = None
         self._description = None
 
     @Throttle(MIN_TIME_BETWEEN_UPDATES)
     async def async_update(self):
         """Update Condition and Forecast."""
-        with async_timeout.timeout(10):
-            _new_condition = await self._station.observation()
-            if _new_condition is None:
-                _LOGGER.warning("Could not update weather conditions")
-                return
-            self._condition = _new_condition
+        _new_condition = await asyncio.wait_for(
+            self._station.observation(), 10)
+        if _new_condition is None:
+            _LOGGER.warning("Could not update weather conditions")
+            return
+        self._condition = _new_condition
 
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug("Updating station %s, condition %s",
                           self._station.local, self._condition)
-            self._forecast = await self._station.forecast()
-            self._description = self._forecast[0].description
+        self._forecast = await asyncio.wait_for(self._station.forecast(), 10)
+        self._description = self._forecast[0].description
+        self._forecast_data = [{
+            ATTR_FORECAST_TIME: data_in.forecastDate,
+            ATTR_FORECAST_CONDITION:
+                ID_TO_CONDITION.get(int(data_in.idWeatherType)),
+            ATTR_FORECAST_TEMP_LOW: data_in.tMin,
+            ATTR_FORECAST_TEMP: data_in.tMax,
+            ATTR_FORECAST_PRECIPITATION: data_in.precipitaProb,
+        } for data_in in self._forecast]
 
     @property
     def unique_id(self) -> str:
         """Return a unique id."""
-        return '{}, {}'.format(self._station.latitude, self._station.longitude)
+        return self._unique_id
 
     @property
     def attribution(self):
@@ -139,8 +155,7 @@ class IPMAWeather(WeatherEntity):
         if not self._forecast:
             return
 
-        return next((k for k, v in CONDITION_CLASSES.items()
-                     if self._forecast[0].idWeatherType in v), None)
+        return ID_TO_CONDITION.get(self._forecast[0].idWeatherType)
 
     @property
     def temperature(self):
@@ -190,22 +205,12 @@ class IPMAWeather(WeatherEntity):
     @property
     def forecast(self):
         """Return the forecast array."""
-        if self._forecast:
-            fcdata_out = []
-            for data_in in self._forecast:
-                data_out = {ATTR_FORECAST_TIME: data_in.forecastDate, ATTR_FORECAST_CONDITION: next((k for k, v in CONDITION_CLASSES.items()
-                          if int(data_in.idWeatherType) in v), None), ATTR_FORECAST_TEMP_LOW: data_in.tMin, ATTR_FORECAST_TEMP: data_in.tMax, ATTR_FORECAST_PRECIPITATION: data_in.precipitaProb}
-
-                fcdata_out.append(data_out)
-
-            return fcdata_out
+        return self._forecast_data
 
     @property
     def device_state_attributes(self):
         """Return the state attributes."""
-        data = {}
-
         if self._description:
-            data[ATTR_WEATHER_DESCRIPTION] = self._description
+            return {ATTR_WEATHER_DESCRIPTION: self._description}
 
-        return data
+        return {}
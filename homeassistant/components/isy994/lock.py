@@ -19,12 +19,11 @@ VALUE_TO_STATE = {
 def setup_platform(hass, config: ConfigType,
                    add_entities: Callable[[list], None], discovery_info=None):
     """Set up the ISY994 lock platform."""
-    devices = []
-    for node in hass.data[ISY994_NODES][DOMAIN]:
-        devices.append(ISYLockDevice(node))
-
-    for name, status, actions in hass.data[ISY994_PROGRAMS][DOMAIN]:
-        devices.append(ISYLockProgram(name, status, actions))
+    devices = [ISYLockDevice(node)
+               for node in hass.data[ISY994_NODES][DOMAIN]]
+    devices.extend(ISYLockProgram(name, status, actions)
+                   for name, status, actions
+                   in hass.data[ISY994_PROGRAMS][DOMAIN])
 
     add_entities(devices)
 
@@ -32,28 +31,43 @@ def setup_platform(hass, config: ConfigType,
 class ISYLockDevice(ISYDevice, LockDevice):
     """Representation of an ISY994 lock device."""
 
+    _value_to_state = VALUE_TO_STATE.get
+
     def __init__(self, node) -> None:
         """Initialize the ISY994 lock device."""
         super().__init__(node)
         self._conn = node.parent.parent.conn
+        self._secmd_url_base = None
+        self._is_locked = self.state == STATE_LOCKED
+
+    def on_update(self, event: object) -> None:
+        """Cache the locked state when the ISY994 node value changes."""
+        self._is_locked = self.state == STATE_LOCKED
+        super().on_update(event)
 
     @property
     def is_locked(self) -> bool:
         """Get whether the lock is in locked state."""
-        return self.state == STATE_LOCKED
+        return self._is_locked
 
     @property
     def state(self) -> str:
         """Get the state of the lock."""
         if self.is_unknown():
             return None
-        return VALUE_TO_STATE.get(self.value, STATE_UNKNOWN)
+        return self._value_to_state(self.value, STATE_UNKNOWN)
+
+    def _secmd_url(self, command: str) -> str:
+        """Return the URL of a secure lock command for this node."""
+        if self._secmd_url_base is None:
+            self._secmd_url_base = self._conn.compileURL(
+                ['nodes', self.unique_id, 'cmd', 'SECMD'])
+        return '{}/{}'.format(self._secmd_url_base, command)
 
     def lock(self, **kwargs) -> None:
         """Send the lock command to the ISY994 device."""
         # Hack until PyISY is updated
-        req_url = self._conn.compileURL(['nodes', self.unique_id, 'cmd',
-                                         'SECMD', '1'])
+        req_url = self._secmd_url('1')
         response = self._conn.request(req_url)
 
         if response is None:
@@ -64,8 +78,7 @@ class ISYLockDevice(ISYDevice, LockDevice):
     def unlock(self, **kwargs) -> None:
         """Send the unlock command to the ISY994 device."""
         # Hack until PyISY is updated
-        req_url = self._conn.compileURL(['nodes', self.unique_id, 'cmd',
-                                         'SECMD', '0'])
+        req_url = self._secmd_url('0')
         response = self._conn.request(req_url)
 
         if response is None:
@@ -13,13 +13,12 @@ _LOGGER = logging.getLogger(__name__)
 def setup_platform(hass, config: ConfigType,
                    add_entities: Callable[[list], None], discovery_info=None):
     """Set up the ISY994 switch platform."""
-    devices = []
-    for node in hass.data[ISY994_NODES][DOMAIN]:
-        if not node.dimmable:
-            devices.append(ISYSwitchDevice(node))
-
-    for name, status, actions in hass.data[ISY994_PROGRAMS][DOMAIN]:
-        devices.append(ISYSwitchProgram(name, status, actions))
+    devices = [ISYSwitchDevice(node)
+               for node in hass.data[ISY994_NODES][DOMAIN]
+               if not node.dimmable]
+    devices.extend(ISYSwitchProgram(name, status, actions)
+                   for name, status, actions
+                   in hass.data[ISY994_PROGRAMS][DOMAIN])
 
     add_entities(devices)
 
@@ -27,10 +26,20 @@ def setup_platform(hass, config: ConfigType,
 class ISYSwitchDevice(ISYDevice, SwitchDevice):
     """Representation of an ISY994 switch device."""
 
+    def __init__(self, node) -> None:
+        """Initialize the ISY994 switch device."""
+        super().__init__(node)
+        self._is_on = bool(self.value)
+
+    def on_update(self, event: object) -> None:
+        """Cache the on state when the ISY994 node value changes."""
+        self._is_on = bool(self.value)
+        super().on_update(event)
+
     @property
     def is_on(self) -> bool:
         """Get whether the ISY994 device is in the on state."""
-        return bool(self.value)
+        return self._is_on
 
     def turn_off(self, **kwargs) -> None:
         """Send the turn on command to the ISY994 switch."""
@@ -52,11 +61,6 @@ class ISYSwitchProgram(ISYSwitchDevice):
         self._name = name
         self._actions = actions
 
-    @property
-    def is_on(self) -> bool:
-        """Get whether the ISY994 switch program is on."""
-        return bool(self.value)
-
     def turn_on(self, **kwargs) -> None:
         """Send the turn on command to the ISY994 switch program."""
         if not self._actions.runThen():
@@ -1,6 +1,6 @@
 """Sensor for Last.fm account status."""
+from datetime import timedelta
 import logging
-import re
 
 import voluptuous as vol
 
@@ -8,6 +8,7 @@ from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import CONF_API_KEY, ATTR_ATTRIBUTION
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
+from homeassistant.util import Throttle
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -20,6 +21,8 @@ CONF_USERS = 'users'
 
 ICON = 'mdi:lastfm'
 
+MIN_TIME_BETWEEN_UPDATES = timedelta(minutes=5)
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Required(CONF_API_KEY): cv.string,
     vol.Required(CONF_USERS, default=[]): vol.All(cv.ensure_list, [cv.string]),
@@ -36,26 +39,69 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
 
     lastfm_api = lastfm.LastFMNetwork(api_key=api_key)
 
-    entities = []
+    lastfm_users = {}
     for username in users:
+        user = lastfm_api.get_user(username)
         try:
-            lastfm_api.get_user(username).get_image()
-            entities.append(LastfmSensor(username, lastfm_api))
+            user.get_image()
         except WSError as error:
             _LOGGER.error(error)
             return
+        lastfm_users[username] = user
+
+    lastfm_data = LastfmData(lastfm_users)
+    add_entities(
+        [LastfmSensor(username, lastfm_data) for username in users], True)
 
-    add_entities(entities, True)
+
+class LastfmData:
+    """Get the latest data from Last.fm for all configured users."""
+
+    def __init__(self, users):
+        """Initialize the data object."""
+        self._users = users
+        self.data = {}
+
+    @Throttle(MIN_TIME_BETWEEN_UPDATES)
+    def update(self):
+        """Get the latest data from Last.fm for every user in one pass."""
+        from pylast import MalformedResponseError, NetworkError, WSError
+
+        for username, user in self._users.items():
+            # Keep the previous data of a failing user, fetch the others
+            try:
+                self.data[username] = self._fetch_user(user)
+            except (WSError, MalformedResponseError, NetworkError,
+                    IndexError) as error:
+                _LOGGER.error("Unable to update Last.fm user %s: %s",
+                              username, error)
+
+    @staticmethod
+    def _fetch_user(user):
+        """Fetch the account status of a single Last.fm user."""
+        last = user.get_recent_tracks(limit=2)[0]
+        top = user.get_top_tracks(limit=1)[0].item
+        now = user.get_now_playing()
+
+        return {
+            'cover': user.get_image(),
+            'playcount': user.get_playcount(),
+            'lastplayed': "{} - {}".format(
+                last.track.artist, last.track.title),
+            'topplayed': "{} - {}".format(top.artist, top.title),
+            'nowplaying': None if now is None else "{} - {}".format(
+                now.artist, now.title),
+        }
 
 
 class LastfmSensor(Entity):
     """A class for the Last.fm account."""
 
-    def __init__(self, user, lastfm):
+    def __init__(self, user, lastfm_data):
         """Initialize the sensor."""
-        self._user = lastfm.get_user(user)
+        self.entity_id = 'sensor.lastfm_{}'.format(user)
         self._name = user
-        self._lastfm = lastfm
+        self._lastfm_data = lastfm_data
         self._state = "Not Scrobbling"
         self._playcount = None
         self._lastplayed = None
@@ -67,11 +113,6 @@ class LastfmSensor(Entity):
         """Return the name of the sensor."""
         return self._name
 
-    @property
-    def entity_id(self):
-        """Return the entity ID."""
-        return 'sensor.lastfm_{}'.format(self._name)
-
     @property
     def state(self):
         """Return the state of the sensor."""
@@ -79,21 +120,19 @@ class LastfmSensor(Entity):
 
     def update(self):
         """Update device state."""
-        self._cover = self._user.get_image()
-        self._playcount = self._user.get_playcount()
-        last = self._user.get_recent_tracks(limit=2)[0]
-        self._lastplayed = "{} - {}".format(
-            last.track.artist, last.track.title)
-        top = self._user.get_top_tracks(limit=1)[0]
-        toptitle = re.search("', '(.+?)',", str(top))
-        topartist = re.search("'(.+?)',", str(top))
-        self._topplayed = "{} - {}".format(
-            topartist.group(1), toptitle.group(1))
-        if self._user.get_now_playing() is None:
+        self._lastfm_data.update()
+        data = self._lastfm_data.data.get(self._name)
+        if data is None:
+            return
+
+        self._cover = data['cover']
+        self._playcount = data['playcount']
+        self._lastplayed = data['lastplayed']
+        self._topplayed = data['topplayed']
+        if data['nowplaying'] is None:
             self._state = "Not Scrobbling"
             return
-        now = self._user.get_now_playing()
-        self._state = "{} - {}".format(now.artist, now.title)
+        self._state = data['nowplaying']
 
     @property
     def device_state_attributes(self):
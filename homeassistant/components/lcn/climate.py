@@ -129,13 +129,15 @@ class LcnClimate(LcnDevice, ClimateDevice):
         if not isinstance(input_obj, pypck.inputs.ModStatusVar):
             return
 
-        if input_obj.get_var() == self.variable:
-            self._current_temperature = \
-                input_obj.get_value().to_var_unit(self.unit)
-        elif input_obj.get_var() == self.setpoint:
-            self._is_on = not input_obj.get_value().is_locked_regulator()
-            if self.is_on:
-                self._target_temperature = \
-                    input_obj.get_value().to_var_unit(self.unit)
+        var = input_obj.get_var()
+        value = input_obj.get_value()
+        if var == self.variable:
+            self._current_temperature = value.to_var_unit(self.unit)
+        elif var == self.setpoint:
+            self._is_on = not value.is_locked_regulator()
+            if self._is_on:
+                self._target_temperature = value.to_var_unit(self.unit)
+        else:
+            return
 
         self.async_schedule_update_ha_state()
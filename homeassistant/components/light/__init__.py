@@ -2,6 +2,7 @@
 import asyncio
 import csv
 from datetime import timedelta
+from functools import lru_cache
 import logging
 import os
 
@@ -119,6 +120,9 @@ LIGHT_TURN_OFF_SCHEMA = vol.Schema({
 
 LIGHT_TOGGLE_SCHEMA = LIGHT_TURN_ON_SCHEMA
 
+# Parameters kept when a turn on request turns the light off
+TURN_OFF_PARAMS = frozenset((ATTR_TRANSITION, ATTR_FLASH))
+
 PROFILE_SCHEMA = vol.Schema(
     vol.ExactSequence((str, cv.small_float, cv.small_float, cv.byte))
 )
@@ -127,6 +131,37 @@ INTENT_SET = 'HassLightSet'
 
 _LOGGER = logging.getLogger(__name__)
 
+# Parsed profiles per file path, with the (mtime, size) they were read at
+_PROFILES_CACHE = {}
+
+# Service calls keep repeating the same handful of color names and
+# temperatures, so memoize their conversions.
+_color_name_to_rgb = lru_cache(maxsize=256)(color_util.color_name_to_rgb)
+_kelvin_to_mired = lru_cache(maxsize=256)(
+    color_util.color_temperature_kelvin_to_mired)
+
+
+def _parse_profile_row(rec):
+    """Parse a light profile CSV row into name, x, y and brightness.
+
+    Equivalent to validating the row with PROFILE_SCHEMA, without the
+    voluptuous overhead for every row of a large profiles file.
+    """
+    if len(rec) != 4:
+        raise ValueError("expected 4 columns, got {}".format(len(rec)))
+
+    profile, color_x, color_y, brightness = rec
+    color_x = float(color_x)
+    color_y = float(color_y)
+    brightness = int(brightness)
+
+    if not (0 <= color_x <= 1 and 0 <= color_y <= 1):
+        raise ValueError("color values must be between 0 and 1")
+    if not 0 <= brightness <= 255:
+        raise ValueError("brightness must be between 0 and 255")
+
+    return profile, color_x, color_y, brightness
+
 
 @bind_hass
 def is_on(hass, entity_id=None):
@@ -139,13 +174,13 @@ def preprocess_turn_on_alternatives(params):
     """Process extra data for turn light on request."""
     profile = Profiles.get(params.pop(ATTR_PROFILE, None))
     if profile is not None:
-        params.setdefault(ATTR_XY_COLOR, profile[:2])
+        params.setdefault(ATTR_HS_COLOR, profile[:2])
         params.setdefault(ATTR_BRIGHTNESS, profile[2])
 
     color_name = params.pop(ATTR_COLOR_NAME, None)
     if color_name is not None:
         try:
-            params[ATTR_RGB_COLOR] = color_util.color_name_to_rgb(color_name)
+            params[ATTR_RGB_COLOR] = _color_name_to_rgb(color_name)
         except ValueError:
             _LOGGER.warning('Got unknown color %s, falling back to white',
                             color_name)
@@ -153,7 +188,7 @@ def preprocess_turn_on_alternatives(params):
 
     kelvin = params.pop(ATTR_KELVIN, None)
     if kelvin is not None:
-        mired = color_util.color_temperature_kelvin_to_mired(kelvin)
+        mired = _kelvin_to_mired(kelvin)
         params[ATTR_COLOR_TEMP] = int(mired)
 
     brightness_pct = params.pop(ATTR_BRIGHTNESS_PCT, None)
@@ -173,8 +208,7 @@ def preprocess_turn_off(params):
     """Process data for turning light off if brightness is 0."""
     if ATTR_BRIGHTNESS in params and params[ATTR_BRIGHTNESS] == 0:
         # Zero brightness: Light will be turned off
-        params = {k: v for k, v in params.items() if k in [ATTR_TRANSITION,
-                                                           ATTR_FLASH]}
+        params = {k: v for k, v in params.items() if k in TURN_OFF_PARAMS}
         return (True, params)  # Light should be turned off
 
     return (False, None)  # Light should be turned on
@@ -196,8 +230,8 @@ class SetIntentHandler(intent.IntentHandler):
         slots = self.async_validate_slots(intent_obj.slots)
         state = hass.helpers.intent.async_match_state(
             slots['name']['value'],
-            [state for state in hass.states.async_all()
-             if state.domain == DOMAIN])
+            (state for state in hass.states.async_all()
+             if state.domain == DOMAIN))
 
         service_data = {
             ATTR_ENTITY_ID: state.entity_id,
@@ -226,16 +260,11 @@ class SetIntentHandler(intent.IntentHandler):
 
         if not speech_parts:  # No attributes changed
             speech = 'Turned on {}'.format(state.name)
+        elif len(speech_parts) == 1:
+            speech = 'Changed {} to {}'.format(state.name, speech_parts[0])
         else:
-            parts = ['Changed {} to'.format(state.name)]
-            for index, part in enumerate(speech_parts):
-                if index == 0:
-                    parts.append(' {}'.format(part))
-                elif index != len(speech_parts) - 1:
-                    parts.append(', {}'.format(part))
-                else:
-                    parts.append(' and {}'.format(part))
-            speech = ''.join(parts)
+            speech = 'Changed {} to {} and {}'.format(
+                state.name, ', '.join(speech_parts[:-1]), speech_parts[-1])
 
         response.async_set_speech(speech)
         return response
@@ -279,6 +308,9 @@ async def async_setup(hass, config):
         preprocess_turn_on_alternatives(params)
         turn_lights_off, off_params = preprocess_turn_off(params)
 
+        # Lights without parameters share the work per default profile
+        default_params = {}
+
         update_tasks = []
         for light in target_lights:
             light.async_set_context(service.context)
@@ -287,10 +319,13 @@ async def async_setup(hass, config):
             off_pars = off_params
             turn_light_off = turn_lights_off
             if not pars:
-                pars = params.copy()
-                pars[ATTR_PROFILE] = Profiles.get_default(light.entity_id)
-                preprocess_turn_on_alternatives(pars)
-                turn_light_off, off_pars = preprocess_turn_off(pars)
+                profile = Profiles.get_default(light.entity_id)
+                if profile not in default_params:
+                    pars = {ATTR_PROFILE: profile}
+                    preprocess_turn_on_alternatives(pars)
+                    default_params[profile] = (
+                        pars, preprocess_turn_off(pars))
+                pars, (turn_light_off, off_pars) = default_params[profile]
             if turn_light_off:
                 await light.async_turn_off(**off_pars)
             else:
@@ -303,7 +338,12 @@ async def async_setup(hass, config):
                 light.async_update_ha_state(True))
 
         if update_tasks:
-            await asyncio.wait(update_tasks)
+            results = await asyncio.gather(
+                *update_tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, Exception):
+                    _LOGGER.error("Error updating light state: %s", result,
+                                  exc_info=result)
 
     # Listen for light on and light off service calls.
     hass.services.async_register(
@@ -351,8 +391,17 @@ class Profiles:
             profiles = {}
 
             for profile_path in profile_paths:
-                if not os.path.isfile(profile_path):
+                try:
+                    stat = os.stat(profile_path)
+                except OSError:
+                    continue
+
+                signature = (stat.st_mtime_ns, stat.st_size)
+                cached = _PROFILES_CACHE.get(profile_path)
+                if cached is not None and cached[0] == signature:
+                    profiles.update(cached[1])
                     continue
+
                 with open(profile_path) as inp:
                     reader = csv.reader(inp)
 
@@ -360,15 +409,20 @@ class Profiles:
                     next(reader, None)
 
                     try:
-                        for rec in reader:
-                            profile, color_x, color_y, brightness = \
-                                PROFILE_SCHEMA(rec)
-                            profiles[profile] = (color_x, color_y, brightness)
-                    except vol.MultipleInvalid as ex:
+                        file_profiles = {
+                            profile: color_util.color_xy_to_hs(
+                                color_x, color_y) + (brightness,)
+                            for profile, color_x, color_y, brightness
+                            in map(_parse_profile_row, reader)
+                        }
+                    except ValueError as ex:
                         _LOGGER.error(
                             "Error parsing light profile from %s: %s",
                             profile_path, ex)
                         return None
+
+                _PROFILES_CACHE[profile_path] = (signature, file_profiles)
+                profiles.update(file_profiles)
             return profiles
 
         cls._all = await hass.async_add_job(load_profile_data, hass)
@@ -395,6 +449,9 @@ class Profiles:
 class Light(ToggleEntity):
     """Representation of a light."""
 
+    # Last reported hs color with its RGB and xy conversions
+    _hs_conversions = None
+
     @property
     def brightness(self):
         """Return the brightness of this light between 0..255."""
@@ -466,8 +523,16 @@ class Light(ToggleEntity):
                     round(hs_color[0], 3),
                     round(hs_color[1], 3),
                 )
-                data[ATTR_RGB_COLOR] = color_util.color_hs_to_RGB(*hs_color)
-                data[ATTR_XY_COLOR] = color_util.color_hs_to_xy(*hs_color)
+                conversions = self._hs_conversions
+                if conversions is None or conversions[0] != tuple(hs_color):
+                    rgb_color = color_util.color_hs_to_RGB(*hs_color)
+                    conversions = self._hs_conversions = (
+                        tuple(hs_color),
+                        rgb_color,
+                        color_util.color_RGB_to_xy(*rgb_color),
+                    )
+                data[ATTR_RGB_COLOR] = conversions[1]
+                data[ATTR_XY_COLOR] = conversions[2]
 
             if supported_features & SUPPORT_WHITE_VALUE:
                 data[ATTR_WHITE_VALUE] = self.white_value
@@ -15,13 +15,15 @@ _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass, entry, async_add_entities):
     """Configure a dispatcher connection based on a config entry."""
+    devices = hass.data[LT_DOMAIN]['devices']
+
     @callback
     def _receive_data(device, location, location_name):
         """Receive set location."""
-        if device in hass.data[LT_DOMAIN]['devices']:
+        if device in devices:
             return
 
-        hass.data[LT_DOMAIN]['devices'].add(device)
+        devices.add(device)
 
         async_add_entities([LocativeEntity(
             device, location, location_name
@@ -36,6 +38,8 @@ async def async_setup_entry(hass, entry, async_add_entities):
 class LocativeEntity(DeviceTrackerEntity):
     """Represent a tracked device."""
 
+    __slots__ = ['_name', '_location', '_location_name', '_unsub_dispatcher']
+
     def __init__(self, device, location, location_name):
         """Set up Locative entity."""
         self._name = device
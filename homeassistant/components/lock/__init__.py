@@ -38,11 +38,6 @@ SUPPORT_OPEN = 1
 
 _LOGGER = logging.getLogger(__name__)
 
-PROP_TO_ATTR = {
-    'changed_by': ATTR_CHANGED_BY,
-    'code_format': ATTR_CODE_FORMAT,
-}
-
 
 @bind_hass
 def is_locked(hass, entity_id=None):
@@ -139,10 +134,12 @@ class LockDevice(Entity):
     def state_attributes(self):
         """Return the state attributes."""
         state_attr = {}
-        for prop, attr in PROP_TO_ATTR.items():
-            value = getattr(self, prop)
-            if value is not None:
-                state_attr[attr] = value
+        changed_by = self.changed_by
+        if changed_by is not None:
+            state_attr[ATTR_CHANGED_BY] = changed_by
+        code_format = self.code_format
+        if code_format is not None:
+            state_attr[ATTR_CODE_FORMAT] = code_format
         return state_attr
 
     @property
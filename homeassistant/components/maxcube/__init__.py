@@ -81,9 +81,25 @@ class MaxCubeHandle:
         self.scan_interval = scan_interval
         self.mutex = Lock()
         self._updatets = time.time()
+        self._devices = {device.rf_address: device for device in cube.devices}
+
+    def device_by_rf(self, rf_address):
+        """Return the cube device with the given RF address."""
+        device = self._devices.get(rf_address)
+        if device is None:
+            device = self.cube.device_by_rf(rf_address)
+            if device is not None:
+                self._devices[rf_address] = device
+        return device
 
     def update(self):
         """Pull the latest data from the MAX! Cube."""
+        # Entities of the same cube share this update, skip without
+        # waiting for the mutex while the data is still fresh
+        if (time.time() - self._updatets) < self.scan_interval:
+            _LOGGER.debug("Skipping update")
+            return
+
         # Acquire mutex to prevent simultaneous update from multiple threads
         with self.mutex:
             # Only update every update_interval
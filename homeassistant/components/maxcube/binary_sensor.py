@@ -29,6 +29,9 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
 class MaxCubeShutter(BinarySensorDevice):
     """Representation of a MAX! Cube Binary Sensor device."""
 
+    __slots__ = ['_name', '_sensor_type', '_rf_address', '_cubehandle',
+                 '_state']
+
     def __init__(self, handler, name, rf_address):
         """Initialize MAX! Cube BinarySensorDevice."""
         self._name = name
@@ -60,5 +63,5 @@ class MaxCubeShutter(BinarySensorDevice):
     def update(self):
         """Get latest data from MAX! Cube."""
         self._cubehandle.update()
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
         self._state = device.is_open
@@ -64,13 +64,13 @@ class MaxCubeClimate(ClimateDevice):
     @property
     def min_temp(self):
         """Return the minimum temperature."""
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
         return self.map_temperature_max_hass(device.min_temperature)
 
     @property
     def max_temp(self):
         """Return the maximum temperature."""
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
         return self.map_temperature_max_hass(device.max_temperature)
 
     @property
@@ -81,7 +81,7 @@ class MaxCubeClimate(ClimateDevice):
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
 
         # Map and return current temperature
         return self.map_temperature_max_hass(device.actual_temperature)
@@ -89,7 +89,7 @@ class MaxCubeClimate(ClimateDevice):
     @property
     def current_operation(self):
         """Return current operation (auto, manual, boost, vacation)."""
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
         return self.map_mode_max_hass(device.mode)
 
     @property
@@ -100,7 +100,7 @@ class MaxCubeClimate(ClimateDevice):
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
         return self.map_temperature_max_hass(device.target_temperature)
 
     def set_temperature(self, **kwargs):
@@ -109,7 +109,7 @@ class MaxCubeClimate(ClimateDevice):
             return False
 
         target_temperature = kwargs.get(ATTR_TEMPERATURE)
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
 
         cube = self._cubehandle.cube
 
@@ -122,7 +122,7 @@ class MaxCubeClimate(ClimateDevice):
 
     def set_operation_mode(self, operation_mode):
         """Set new operation mode."""
-        device = self._cubehandle.cube.device_by_rf(self._rf_address)
+        device = self._cubehandle.device_by_rf(self._rf_address)
         mode = self.map_mode_hass_max(operation_mode)
 
         if mode is None:
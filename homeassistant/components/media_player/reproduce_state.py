@@ -27,53 +27,80 @@ from .const import (
 )
 
 
+STATE_TO_SERVICE = {
+    STATE_ON: SERVICE_TURN_ON,
+    STATE_OFF: SERVICE_TURN_OFF,
+    STATE_PLAYING: SERVICE_MEDIA_PLAY,
+    STATE_IDLE: SERVICE_MEDIA_STOP,
+    STATE_PAUSED: SERVICE_MEDIA_PAUSE,
+}
+
+
+async def _async_call_service(hass: HomeAssistantType,
+                              state: State,
+                              context: Optional[Context],
+                              service: str,
+                              keys: Iterable) -> None:
+    """Call service with set of attributes given."""
+    attributes = state.attributes
+    data = {'entity_id': state.entity_id}
+    for key in keys:
+        if key in attributes:
+            data[key] = attributes[key]
+
+    await hass.services.async_call(
+        DOMAIN, service, data,
+        blocking=True, context=context)
+
+
 async def _async_reproduce_states(hass: HomeAssistantType,
                                   state: State,
                                   context: Optional[Context] = None) -> None:
     """Reproduce component states."""
-    async def call_service(service: str, keys: Iterable):
-        """Call service with set of attributes given."""
-        data = {'entity_id': state.entity_id}
-        for key in keys:
-            if key in state.attributes:
-                data[key] = state.attributes[key]
-
-        await hass.services.async_call(
-            DOMAIN, service, data,
-            blocking=True, context=context)
-
-    if state.state == STATE_ON:
-        await call_service(SERVICE_TURN_ON, [])
-    elif state.state == STATE_OFF:
-        await call_service(SERVICE_TURN_OFF, [])
-    elif state.state == STATE_PLAYING:
-        await call_service(SERVICE_MEDIA_PLAY, [])
-    elif state.state == STATE_IDLE:
-        await call_service(SERVICE_MEDIA_STOP, [])
-    elif state.state == STATE_PAUSED:
-        await call_service(SERVICE_MEDIA_PAUSE, [])
-
-    if ATTR_MEDIA_VOLUME_LEVEL in state.attributes:
-        await call_service(SERVICE_VOLUME_SET, [ATTR_MEDIA_VOLUME_LEVEL])
-
-    if ATTR_MEDIA_VOLUME_MUTED in state.attributes:
-        await call_service(SERVICE_VOLUME_MUTE, [ATTR_MEDIA_VOLUME_MUTED])
-
-    if ATTR_MEDIA_SEEK_POSITION in state.attributes:
-        await call_service(SERVICE_MEDIA_SEEK, [ATTR_MEDIA_SEEK_POSITION])
-
-    if ATTR_INPUT_SOURCE in state.attributes:
-        await call_service(SERVICE_SELECT_SOURCE, [ATTR_INPUT_SOURCE])
-
-    if ATTR_SOUND_MODE in state.attributes:
-        await call_service(SERVICE_SELECT_SOUND_MODE, [ATTR_SOUND_MODE])
-
-    if (ATTR_MEDIA_CONTENT_TYPE in state.attributes) and \
-       (ATTR_MEDIA_CONTENT_ID in state.attributes):
-        await call_service(SERVICE_PLAY_MEDIA,
-                           [ATTR_MEDIA_CONTENT_TYPE,
-                            ATTR_MEDIA_CONTENT_ID,
-                            ATTR_MEDIA_ENQUEUE])
+    attributes = state.attributes
+
+    service = STATE_TO_SERVICE.get(state.state)
+    if service is not None:
+        await _async_call_service(hass, state, context, service, [])
+
+    # The attribute services below do not depend on each other
+    pending = []
+
+    if ATTR_MEDIA_VOLUME_LEVEL in attributes:
+        pending.append(_async_call_service(
+            hass, state, context, SERVICE_VOLUME_SET,
+            [ATTR_MEDIA_VOLUME_LEVEL]))
+
+    if ATTR_MEDIA_VOLUME_MUTED in attributes:
+        pending.append(_async_call_service(
+            hass, state, context, SERVICE_VOLUME_MUTE,
+            [ATTR_MEDIA_VOLUME_MUTED]))
+
+    if ATTR_MEDIA_SEEK_POSITION in attributes:
+        pending.append(_async_call_service(
+            hass, state, context, SERVICE_MEDIA_SEEK,
+            [ATTR_MEDIA_SEEK_POSITION]))
+
+    if ATTR_INPUT_SOURCE in attributes:
+        pending.append(_async_call_service(
+            hass, state, context, SERVICE_SELECT_SOURCE,
+            [ATTR_INPUT_SOURCE]))
+
+    if ATTR_SOUND_MODE in attributes:
+        pending.append(_async_call_service(
+            hass, state, context, SERVICE_SELECT_SOUND_MODE,
+            [ATTR_SOUND_MODE]))
+
+    if pending:
+        await asyncio.gather(*pending)
+
+    if (ATTR_MEDIA_CONTENT_TYPE in attributes) and \
+       (ATTR_MEDIA_CONTENT_ID in attributes):
+        await _async_call_service(
+            hass, state, context, SERVICE_PLAY_MEDIA,
+            [ATTR_MEDIA_CONTENT_TYPE,
+             ATTR_MEDIA_CONTENT_ID,
+             ATTR_MEDIA_ENQUEUE])
 
 
 @bind_hass
@@ -54,6 +54,27 @@ class MelissaClimate(ClimateDevice):
         self._data = init_data['controller_log']
         self._state = None
         self._cur_settings = None
+        self._state_to_hass = {
+            api.STATE_ON: STATE_ON,
+            api.STATE_OFF: STATE_OFF,
+            api.STATE_IDLE: STATE_IDLE,
+        }
+        self._op_to_hass = {
+            api.MODE_HEAT: STATE_HEAT,
+            api.MODE_COOL: STATE_COOL,
+            api.MODE_DRY: STATE_DRY,
+            api.MODE_FAN: STATE_FAN_ONLY,
+        }
+        self._fan_to_hass = {
+            api.FAN_AUTO: STATE_AUTO,
+            api.FAN_LOW: SPEED_LOW,
+            api.FAN_MEDIUM: SPEED_MEDIUM,
+            api.FAN_HIGH: SPEED_HIGH,
+        }
+        self._hass_to_op = {
+            hass_mode: mode for mode, hass_mode in self._op_to_hass.items()}
+        self._hass_to_fan = {
+            hass_fan: fan for fan, hass_fan in self._fan_to_hass.items()}
 
     @property
     def name(self):
@@ -168,14 +189,17 @@ class MelissaClimate(ClimateDevice):
 
     async def async_send(self, value):
         """Send action to service."""
-        try:
-            old_value = self._cur_settings.copy()
-            self._cur_settings.update(value)
-        except AttributeError:
-            old_value = None
-        if not await self._api.async_send(
-                self._serial_number, self._cur_settings):
-            self._cur_settings = old_value
+        settings = self._cur_settings
+        if settings is None:
+            await self._api.async_send(self._serial_number, settings)
+            return
+        # Only remember the keys this command changes, to undo on failure
+        old_value = {key: settings[key] for key in value if key in settings}
+        settings.update(value)
+        if not await self._api.async_send(self._serial_number, settings):
+            settings.update(old_value)
+            for key in value.keys() - old_value.keys():
+                del settings[key]
 
     async def async_update(self):
         """Get latest data from Melissa."""
@@ -191,61 +215,33 @@ class MelissaClimate(ClimateDevice):
 
     def melissa_state_to_hass(self, state):
         """Translate Melissa states to hass states."""
-        if state == self._api.STATE_ON:
-            return STATE_ON
-        if state == self._api.STATE_OFF:
-            return STATE_OFF
-        if state == self._api.STATE_IDLE:
-            return STATE_IDLE
-        return None
+        return self._state_to_hass.get(state)
 
     def melissa_op_to_hass(self, mode):
         """Translate Melissa modes to hass states."""
-        if mode == self._api.MODE_HEAT:
-            return STATE_HEAT
-        if mode == self._api.MODE_COOL:
-            return STATE_COOL
-        if mode == self._api.MODE_DRY:
-            return STATE_DRY
-        if mode == self._api.MODE_FAN:
-            return STATE_FAN_ONLY
-        _LOGGER.warning(
-            "Operation mode %s could not be mapped to hass", mode)
-        return None
+        hass_mode = self._op_to_hass.get(mode)
+        if hass_mode is None:
+            _LOGGER.warning(
+                "Operation mode %s could not be mapped to hass", mode)
+        return hass_mode
 
     def melissa_fan_to_hass(self, fan):
         """Translate Melissa fan modes to hass modes."""
-        if fan == self._api.FAN_AUTO:
-            return STATE_AUTO
-        if fan == self._api.FAN_LOW:
-            return SPEED_LOW
-        if fan == self._api.FAN_MEDIUM:
-            return SPEED_MEDIUM
-        if fan == self._api.FAN_HIGH:
-            return SPEED_HIGH
-        _LOGGER.warning("Fan mode %s could not be mapped to hass", fan)
-        return None
+        hass_fan = self._fan_to_hass.get(fan)
+        if hass_fan is None:
+            _LOGGER.warning("Fan mode %s could not be mapped to hass", fan)
+        return hass_fan
 
     def hass_mode_to_melissa(self, mode):
         """Translate hass states to melissa modes."""
-        if mode == STATE_HEAT:
-            return self._api.MODE_HEAT
-        if mode == STATE_COOL:
-            return self._api.MODE_COOL
-        if mode == STATE_DRY:
-            return self._api.MODE_DRY
-        if mode == STATE_FAN_ONLY:
-            return self._api.MODE_FAN
-        _LOGGER.warning("Melissa have no setting for %s mode", mode)
+        melissa_mode = self._hass_to_op.get(mode)
+        if melissa_mode is None:
+            _LOGGER.warning("Melissa have no setting for %s mode", mode)
+        return melissa_mode
 
     def hass_fan_to_melissa(self, fan):
         """Translate hass fan modes to melissa modes."""
-        if fan == STATE_AUTO:
-            return self._api.FAN_AUTO
-        if fan == SPEED_LOW:
-            return self._api.FAN_LOW
-        if fan == SPEED_MEDIUM:
-            return self._api.FAN_MEDIUM
-        if fan == SPEED_HIGH:
-            return self._api.FAN_HIGH
-        _LOGGER.warning("Melissa have no setting for %s fan mode", fan)
+        melissa_fan = self._hass_to_fan.get(fan)
+        if melissa_fan is None:
+            _LOGGER.warning("Melissa have no setting for %s fan mode", fan)
+        return melissa_fan
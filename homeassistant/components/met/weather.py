@@ -131,7 +131,7 @@ class MetWeather(WeatherEntity):
         # will make sure it will spread it out.
 
         self._unsub_fetch_data = async_call_later(
-            self.hass, randrange(55, 65)*60, self._fetch_data)
+            self.hass, randrange(55 * 60, 65 * 60), self._fetch_data)
         self._update()
 
     def _update(self, *_):
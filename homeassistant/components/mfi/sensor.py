@@ -61,19 +61,52 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
         _LOGGER.error("Unable to connect to mFi: %s", str(ex))
         return False
 
-    add_entities(MfiSensor(port, hass)
+    mfi_data = MfiData(hass, client)
+    add_entities(MfiSensor(port, mfi_data)
                  for device in client.get_devices()
                  for port in device.ports.values()
                  if port.model in SENSOR_MODELS)
 
 
+class MfiData:
+    """Get the latest sensor data from the mFi controller."""
+
+    def __init__(self, hass, client):
+        """Initialize the data object."""
+        self._hass = hass
+        self._client = client
+        self._update_task = None
+        self.sensors = {}
+
+    async def async_update(self):
+        """Get the latest data, sharing a fetch that is already running.
+
+        Sensors are polled concurrently, so all of them wait on the same
+        request instead of each occupying an executor thread.
+        """
+        task = self._update_task
+        if task is None:
+            task = self._update_task = self._hass.async_create_task(
+                self._async_fetch())
+        await task
+
+    async def _async_fetch(self):
+        """Fetch all sensors in a single request."""
+        try:
+            sensors = await self._hass.async_add_executor_job(
+                self._client.get_raw_sensors)
+        finally:
+            self._update_task = None
+        self.sensors = {sensor['_id']: sensor for sensor in sensors}
+
+
 class MfiSensor(Entity):
     """Representation of a mFi sensor."""
 
-    def __init__(self, port, hass):
+    def __init__(self, port, mfi_data):
         """Initialize the sensor."""
         self._port = port
-        self._hass = hass
+        self._mfi_data = mfi_data
 
     @property
     def name(self):
@@ -110,6 +143,9 @@ class MfiSensor(Entity):
             return 'State'
         return tag
 
-    def update(self):
+    async def async_update(self):
         """Get the latest data."""
-        self._port.refresh()
+        await self._mfi_data.async_update()
+        info = self._mfi_data.sensors.get(self._port.ident)
+        if info is not None:
+            self._port.refresh(info)
@@ -52,6 +52,8 @@ class MobileAppEntity(DeviceTrackerEntity, RestoreEntity):
         self._entry = entry
         self._data = data
         self._dispatch_unsub = None
+        self._device_info = None
+        self._device_info_source = None
 
     @property
     def unique_id(self):
@@ -122,7 +124,12 @@ class MobileAppEntity(DeviceTrackerEntity, RestoreEntity):
     @property
     def device_info(self):
         """Return the device info."""
-        return device_info(self._entry.data)
+        # Updating the entry replaces its data, so identity marks staleness
+        registration = self._entry.data
+        if registration is not self._device_info_source:
+            self._device_info = device_info(registration)
+            self._device_info_source = registration
+        return self._device_info
 
     async def async_added_to_hass(self):
         """Call when entity about to be added to Home Assistant."""
@@ -30,6 +30,7 @@ class MobileAppEntity(Entity):
         self._sensor_id = sensor_id(self._registration[CONF_WEBHOOK_ID],
                                     config[ATTR_SENSOR_UNIQUE_ID])
         self._entity_type = config[ATTR_SENSOR_TYPE]
+        self._device_info = device_info(self._registration)
         self.unsub_dispatcher = None
 
     async def async_added_to_hass(self):
@@ -76,7 +77,7 @@ class MobileAppEntity(Entity):
     @property
     def device_info(self):
         """Return device registry information for this entity."""
-        return device_info(self._registration)
+        return self._device_info
 
     async def async_update(self):
         """Get the latest state of the sensor."""
@@ -1,4 +1,5 @@
 """Helpers for mobile_app."""
+from functools import lru_cache
 import logging
 import json
 from typing import Callable, Dict, Tuple
@@ -17,7 +18,24 @@ from .const import (ATTR_APP_DATA, ATTR_APP_ID, ATTR_APP_NAME, ATTR_DEVICE_ID,
 
 _LOGGER = logging.getLogger(__name__)
 
+# Encoders keep no state between calls, so one instance serves all responses
+_JSON_ENCODER = JSONEncoder()
 
+
+@lru_cache(maxsize=32)
+def _secret_box(key: bytes):
+    """Return a SecretBox for key, reused across webhook calls."""
+    from nacl.secret import SecretBox
+    return SecretBox(key)
+
+
+@lru_cache(maxsize=32)
+def _padded_key(key: str, keylen: int) -> bytes:
+    """Return key as bytes, truncated or zero padded to keylen."""
+    return key.encode("utf-8")[:keylen].ljust(keylen, b'\0')
+
+
+@lru_cache(maxsize=1)
 def setup_decrypt() -> Tuple[int, Callable]:
     """Return decryption function and length of key.
 
@@ -28,10 +46,11 @@ def setup_decrypt() -> Tuple[int, Callable]:
 
     def decrypt(ciphertext, key):
         """Decrypt ciphertext using key."""
-        return SecretBox(key).decrypt(ciphertext, encoder=Base64Encoder)
+        return _secret_box(key).decrypt(ciphertext, encoder=Base64Encoder)
     return (SecretBox.KEY_SIZE, decrypt)
 
 
+@lru_cache(maxsize=1)
 def setup_encrypt() -> Tuple[int, Callable]:
     """Return encryption function and length of key.
 
@@ -42,7 +61,7 @@ def setup_encrypt() -> Tuple[int, Callable]:
 
     def encrypt(ciphertext, key):
         """Encrypt ciphertext using key."""
-        return SecretBox(key).encrypt(ciphertext, encoder=Base64Encoder)
+        return _secret_box(key).encrypt(ciphertext, encoder=Base64Encoder)
     return (SecretBox.KEY_SIZE, encrypt)
 
 
@@ -60,12 +79,8 @@ def _decrypt_payload(key: str, ciphertext: str) -> Dict[str, str]:
             "Ignoring encrypted payload because no decryption key known")
         return None
 
-    key = key.encode("utf-8")
-    key = key[:keylen]
-    key = key.ljust(keylen, b'\0')
-
     try:
-        message = decrypt(ciphertext, key)
+        message = decrypt(ciphertext, _padded_key(key, keylen))
         message = json.loads(message.decode("utf-8"))
         _LOGGER.debug("Successfully decrypted mobile_app payload")
         return message
@@ -97,6 +112,7 @@ def error_response(code: str, message: str, status: int = 400,
     }, status=status, headers=headers)
 
 
+@lru_cache(maxsize=1)
 def supports_encryption() -> bool:
     """Test if we support encryption."""
     try:
@@ -134,17 +150,15 @@ def savable_state(hass: HomeAssistantType) -> Dict:
 def webhook_response(data, *, registration: Dict, status: int = 200,
                      headers: Dict = None) -> Response:
     """Return a encrypted response if registration supports it."""
-    data = json.dumps(data, cls=JSONEncoder)
+    data = _JSON_ENCODER.encode(data)
 
     if registration[ATTR_SUPPORTS_ENCRYPTION]:
         keylen, encrypt = setup_encrypt()
 
-        key = registration[CONF_SECRET].encode("utf-8")
-        key = key[:keylen]
-        key = key.ljust(keylen, b'\0')
-
+        key = _padded_key(registration[CONF_SECRET], keylen)
         enc_data = encrypt(data.encode("utf-8"), key).decode("utf-8")
-        data = json.dumps({'encrypted': True, 'encrypted_data': enc_data})
+        # Base64 output never needs JSON escaping
+        data = '{"encrypted": true, "encrypted_data": "' + enc_data + '"}'
 
     return Response(text=data, status=status, content_type='application/json',
                     headers=headers)
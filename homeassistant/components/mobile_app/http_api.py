@@ -16,7 +16,7 @@ from .const import (ATTR_DEVICE_ID, ATTR_SUPPORTS_ENCRYPTION,
                     CONF_CLOUDHOOK_URL, CONF_REMOTE_UI_URL, CONF_SECRET,
                     CONF_USER_ID, DOMAIN, REGISTRATION_SCHEMA)
 
-from .helpers import supports_encryption
+from .helpers import setup_encrypt, supports_encryption
 
 
 class RegistrationsView(HomeAssistantView):
@@ -36,14 +36,13 @@ class RegistrationsView(HomeAssistantView):
             data[CONF_CLOUDHOOK_URL] = \
                 await async_create_cloudhook(hass, webhook_id)
 
-        data[ATTR_DEVICE_ID] = str(uuid.uuid4()).replace("-", "")
+        data[ATTR_DEVICE_ID] = uuid.uuid4().hex
 
         data[CONF_WEBHOOK_ID] = webhook_id
 
         if data[ATTR_SUPPORTS_ENCRYPTION] and supports_encryption():
-            from nacl.secret import SecretBox
-
-            data[CONF_SECRET] = generate_secret(SecretBox.KEY_SIZE)
+            keylen, _ = setup_encrypt()
+            data[CONF_SECRET] = generate_secret(keylen)
 
         data[CONF_USER_ID] = request['hass_user'].id
 
@@ -30,13 +30,36 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
     return True
 
 
+def _connection_alive(sock):
+    """Return if the mochad socket is still open.
+
+    Mochad also broadcasts events to its clients, which are discarded so
+    the next read returns the reply to our own command.
+    """
+    timeout = sock.gettimeout()
+    sock.settimeout(0)
+    try:
+        while sock.recv(4096):
+            pass
+    except BlockingIOError:
+        return True
+    except OSError:
+        return False
+    finally:
+        sock.settimeout(timeout)
+    # An empty read means mochad closed the connection
+    return False
+
+
 class MochadSwitch(SwitchDevice):
     """Representation of a X10 switch over Mochad."""
 
     def __init__(self, hass, ctrl, dev):
         """Initialize a Mochad Switch Device."""
         from pymochad import device
+        from pymochad.exceptions import MochadException
 
+        self._mochad_exception = MochadException
         self._controller = ctrl
         self._address = dev[CONF_ADDRESS]
         self._name = dev.get(CONF_NAME, 'x10_switch_dev_%s' % self._address)
@@ -45,10 +68,13 @@ class MochadSwitch(SwitchDevice):
             ctrl, self._address, comm_type=self._comm_type)
         # Init with false to avoid locking HA for long on CM19A (goes from rf
         # to pl via TM751, but not other way around)
+        self._state = False
+
+    async def async_added_to_hass(self):
+        """Fetch the initial status without blocking platform setup."""
         if self._comm_type == 'pl':
-            self._state = self._get_device_status()
-        else:
-            self._state = False
+            self._state = await self.hass.async_add_executor_job(
+                self._get_device_status)
 
     @property
     def name(self):
@@ -57,36 +83,27 @@ class MochadSwitch(SwitchDevice):
 
     def turn_on(self, **kwargs):
         """Turn the switch on."""
-        from pymochad.exceptions import MochadException
-        _LOGGER.debug("Reconnect %s:%s", self._controller.server,
-                      self._controller.port)
-        with mochad.REQ_LOCK:
-            try:
-                # Recycle socket on new command to recover mochad connection
-                self._controller.reconnect()
-                self.switch.send_cmd('on')
-                # No read data on CM19A which is rf only
-                if self._comm_type == 'pl':
-                    self._controller.read_data()
-                self._state = True
-            except (MochadException, OSError) as exc:
-                _LOGGER.error("Error with mochad communication: %s", exc)
+        self._send_cmd('on', True)
 
     def turn_off(self, **kwargs):
         """Turn the switch off."""
-        from pymochad.exceptions import MochadException
-        _LOGGER.debug("Reconnect %s:%s", self._controller.server,
-                      self._controller.port)
+        self._send_cmd('off', False)
+
+    def _send_cmd(self, cmd, state):
+        """Send a command to the switch and track its new state."""
         with mochad.REQ_LOCK:
             try:
-                # Recycle socket on new command to recover mochad connection
-                self._controller.reconnect()
-                self.switch.send_cmd('off')
+                # Only recycle the socket once mochad dropped the connection
+                if not _connection_alive(self._controller.socket):
+                    _LOGGER.debug("Reconnect %s:%s", self._controller.server,
+                                  self._controller.port)
+                    self._controller.reconnect()
+                self.switch.send_cmd(cmd)
                 # No read data on CM19A which is rf only
                 if self._comm_type == 'pl':
                     self._controller.read_data()
-                self._state = False
-            except (MochadException, OSError) as exc:
+                self._state = state
+            except (self._mochad_exception, OSError) as exc:
                 _LOGGER.error("Error with mochad communication: %s", exc)
 
     def _get_device_status(self):
@@ -29,9 +29,23 @@ DATA_TYPE_FLOAT = 'float'
 DATA_TYPE_INT = 'int'
 DATA_TYPE_UINT = 'uint'
 
+# Struct format characters by data type and register count
+DATA_TYPES = {
+    DATA_TYPE_INT: {1: 'h', 2: 'i', 4: 'q'},
+    DATA_TYPE_UINT: {1: 'H', 2: 'I', 4: 'Q'},
+    DATA_TYPE_FLOAT: {1: 'e', 2: 'f', 4: 'd'},
+}
+
 REGISTER_TYPE_HOLDING = 'holding'
 REGISTER_TYPE_INPUT = 'input'
 
+# Registers a single read request may return
+MAX_BATCH_COUNT = 125
+# Unused registers we read rather than start another request
+MAX_BATCH_GAP = 8
+# Modbus exception code for reading unmapped registers
+EXCEPTION_ILLEGAL_ADDRESS = 2
+
 PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
     vol.Required(CONF_REGISTERS): [{
         vol.Required(CONF_NAME): cv.string,
@@ -56,14 +70,13 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
 
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the Modbus sensors."""
-    sensors = []
-    data_types = {DATA_TYPE_INT: {1: 'h', 2: 'i', 4: 'q'}, DATA_TYPE_UINT: {1: 'H', 2: 'I', 4: 'Q'}, DATA_TYPE_FLOAT: {1: 'e', 2: 'f', 4: 'd'}}
+    registers = []
 
     for register in config.get(CONF_REGISTERS):
         structure = '>i'
         if register.get(CONF_DATA_TYPE) != DATA_TYPE_CUSTOM:
             try:
-                structure = '>{}'.format(data_types[register.get(
+                structure = '>{}'.format(DATA_TYPES[register.get(
                     CONF_DATA_TYPE)][register.get(CONF_COUNT)])
             except KeyError:
                 _LOGGER.error("Unable to detect data type for %s sensor, "
@@ -86,40 +99,127 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
                 "(%d words)", size, register.get(CONF_COUNT))
             continue
 
-        hub_name = register.get(CONF_HUB)
-        hub = hass.data[MODBUS_DOMAIN][hub_name]
-        sensors.append(ModbusRegisterSensor(
-            hub, register.get(CONF_NAME), register.get(CONF_SLAVE),
-            register.get(CONF_REGISTER), register.get(CONF_REGISTER_TYPE),
-            register.get(CONF_UNIT_OF_MEASUREMENT), register.get(CONF_COUNT),
-            register.get(CONF_REVERSE_ORDER), register.get(CONF_SCALE),
-            register.get(CONF_OFFSET), structure,
-            register.get(CONF_PRECISION)))
-
-    if not sensors:
+        registers.append((register, structure))
+
+    if not registers:
         return False
+
+    # Sensors on the same hub, slave and register type share their reads
+    groups = {}
+    for register, structure in registers:
+        key = (register.get(CONF_HUB), register.get(CONF_SLAVE),
+               register.get(CONF_REGISTER_TYPE))
+        groups.setdefault(key, []).append((register, structure))
+
+    sensors = []
+    for (hub_name, slave, register_type), group in groups.items():
+        hub = hass.data[MODBUS_DOMAIN][hub_name]
+        group.sort(key=lambda item: item[0].get(CONF_REGISTER))
+        reader = None
+        for register, structure in group:
+            start = register.get(CONF_REGISTER)
+            end = start + register.get(CONF_COUNT)
+            if reader is None or not reader.extend(start, end):
+                reader = ModbusBatchReader(
+                    hub, slave, register_type, start, end)
+            sensors.append(ModbusRegisterSensor(
+                hub, register.get(CONF_NAME), slave, start,
+                register.get(CONF_UNIT_OF_MEASUREMENT),
+                register.get(CONF_COUNT), register.get(CONF_REVERSE_ORDER),
+                register.get(CONF_SCALE), register.get(CONF_OFFSET),
+                structure, register.get(CONF_PRECISION), reader))
+
     add_entities(sensors)
 
 
+class ModbusBatchReader:
+    """Read the registers of neighbouring sensors in a single request."""
+
+    def __init__(self, hub, slave, register_type, start, end):
+        """Initialize the reader for the registers from start to end."""
+        self._hub = hub
+        self._slave = int(slave) if slave else None
+        self._register_type = register_type
+        self._start = start
+        self._end = end
+        self._registers = None
+        self._consumers = set()
+        self._merged = True
+
+    def extend(self, start, end):
+        """Try to grow the read to also cover start to end."""
+        if start - self._end > MAX_BATCH_GAP:
+            return False
+        end = max(end, self._end)
+        if end - self._start > MAX_BATCH_COUNT:
+            return False
+        self._end = end
+        return True
+
+    def read(self, sensor, register, count):
+        """Return count registers starting at register.
+
+        The hub is read again once a sensor asks a second time, so every
+        polling cycle costs one request for all sensors of this reader.
+        Slaves which refuse the unused registers between sensors get a
+        request per sensor instead.
+        """
+        if not self._merged:
+            return self._read(register, count)
+        # Entities are not hashable, track them by identity
+        if self._registers is None or id(sensor) in self._consumers:
+            self._consumers.clear()
+            self._registers = self._read(
+                self._start, self._end - self._start)
+            if self._registers is None:
+                if not self._merged:
+                    return self._read(register, count)
+                return None
+        self._consumers.add(id(sensor))
+        offset = register - self._start
+        return self._registers[offset:offset + count]
+
+    def _read(self, start, count):
+        """Read count registers starting at start from the hub."""
+        if self._register_type == REGISTER_TYPE_INPUT:
+            result = self._hub.read_input_registers(
+                self._slave, start, count)
+        else:
+            result = self._hub.read_holding_registers(
+                self._slave, start, count)
+        if (self._merged and
+                getattr(result, 'exception_code', None) ==
+                EXCEPTION_ILLEGAL_ADDRESS):
+            _LOGGER.warning(
+                "Slave %s refused reading registers %s to %s, reading "
+                "its sensors separately", self._slave, start,
+                start + count - 1)
+            self._merged = False
+        # Error responses carry no registers
+        return getattr(result, 'registers', None)
+
+
 class ModbusRegisterSensor(RestoreEntity):
     """Modbus register sensor."""
 
-    def __init__(self, hub, name, slave, register, register_type,
-                 unit_of_measurement, count, reverse_order, scale, offset,
-                 structure, precision):
+    def __init__(self, hub, name, slave, register, unit_of_measurement,
+                 count, reverse_order, scale, offset, structure, precision,
+                 reader):
         """Initialize the modbus register sensor."""
         self._hub = hub
+        self._reader = reader
         self._name = name
         self._slave = int(slave) if slave else None
         self._register = int(register)
-        self._register_type = register_type
         self._unit_of_measurement = unit_of_measurement
         self._count = int(count)
         self._reverse_order = reverse_order
         self._scale = scale
         self._offset = offset
-        self._precision = precision
-        self._structure = structure
+        self._format_spec = '.{}f'.format(precision)
+        self._last_raw = None
+        self._registers_struct = struct.Struct('>{}H'.format(self._count))
+        self._structure = struct.Struct(structure)
         self._value = None
 
     async def async_added_to_hass(self):
@@ -146,25 +246,17 @@ class ModbusRegisterSensor(RestoreEntity):
 
     def update(self):
         """Update the state of the sensor."""
-        if self._register_type == REGISTER_TYPE_INPUT:
-            result = self._hub.read_input_registers(
-                self._slave, self._register, self._count)
-        else:
-            result = self._hub.read_holding_registers(
-                self._slave, self._register, self._count)
-        val = 0
-
-        try:
-            registers = result.registers
-            if self._reverse_order:
-                registers.reverse()
-        except AttributeError:
+        registers = self._reader.read(self, self._register, self._count)
+        if registers is None:
             _LOGGER.error("No response from hub %s, slave %s, register %s",
                           self._hub.name, self._slave, self._register)
             return
-        byte_string = b''.join(
-            [x.to_bytes(2, byteorder='big') for x in registers]
-        )
-        val = struct.unpack(self._structure, byte_string)[0]
+        if self._reverse_order:
+            registers = reversed(registers)
+        byte_string = self._registers_struct.pack(*registers)
+        val = self._structure.unpack(byte_string)[0]
+        if val == self._last_raw:
+            return
+        self._last_raw = val
         self._value = format(
-            self._scale * val + self._offset, '.{}f'.format(self._precision))
+            self._scale * val + self._offset, self._format_spec)
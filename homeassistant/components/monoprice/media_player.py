@@ -62,14 +62,21 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
         _LOGGER.error("Error connecting to Monoprice controller")
         return
 
-    sources = {source_id: extra[CONF_NAME] for source_id, extra
-               in config[CONF_SOURCES].items()}
+    # dict source_id -> source name
+    source_id_name = {source_id: extra[CONF_NAME] for source_id, extra
+                      in config[CONF_SOURCES].items()}
+    # dict source name -> source_id
+    source_name_id = {v: k for k, v in source_id_name.items()}
+    # ordered list of all source names
+    source_names = [name for _, name in sorted(
+        (source_id, name) for name, source_id in source_name_id.items())]
 
     hass.data[DATA_MONOPRICE] = []
     for zone_id, extra in config[CONF_ZONES].items():
         _LOGGER.info("Adding zone %d - %s", zone_id, extra[CONF_NAME])
         hass.data[DATA_MONOPRICE].append(MonopriceZone(
-            monoprice, sources, zone_id, extra[CONF_NAME]))
+            monoprice, source_id_name, source_name_id, source_names,
+            zone_id, extra[CONF_NAME]))
 
     add_entities(hass.data[DATA_MONOPRICE], True)
 
@@ -99,22 +106,23 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
 class MonopriceZone(MediaPlayerDevice):
     """Representation of a Monoprice amplifier zone."""
 
-    def __init__(self, monoprice, sources, zone_id, zone_name):
-        """Initialize new zone."""
+    def __init__(self, monoprice, source_id_name, source_name_id,
+                 source_names, zone_id, zone_name):
+        """Initialize new zone.
+
+        The source maps are shared between all zones.
+        """
         self._monoprice = monoprice
-        # dict source_id -> source name
-        self._source_id_name = sources
-        # dict source name -> source_id
-        self._source_name_id = {v: k for k, v in sources.items()}
-        # ordered list of all source names
-        self._source_names = sorted(self._source_name_id.keys(),
-                                    key=lambda v: self._source_name_id[v])
+        self._source_id_name = source_id_name
+        self._source_name_id = source_name_id
+        self._source_names = source_names
         self._zone_id = zone_id
         self._name = zone_name
 
         self._snapshot = None
         self._state = None
         self._volume = None
+        self._volume_level = None
         self._source = None
         self._mute = None
 
@@ -125,6 +133,8 @@ class MonopriceZone(MediaPlayerDevice):
             return False
         self._state = STATE_ON if state.power else STATE_OFF
         self._volume = state.volume
+        self._volume_level = (
+            None if state.volume is None else state.volume / 38.0)
         self._mute = state.mute
         idx = state.source
         if idx in self._source_id_name:
@@ -146,9 +156,7 @@ class MonopriceZone(MediaPlayerDevice):
     @property
     def volume_level(self):
         """Volume level of the media player (0..1)."""
-        if self._volume is None:
-            return None
-        return self._volume / 38.0
+        return self._volume_level
 
     @property
     def is_volume_muted(self):
@@ -37,9 +37,16 @@ async def async_setup_platform(
 class MySensorsHVAC(mysensors.device.MySensorsEntity, ClimateDevice):
     """Representation of a MySensors HVAC."""
 
+    # (number of value types, features) the features were computed for
+    _features_cache = (None, None)
+
     @property
     def supported_features(self):
         """Return the list of supported features."""
+        # Value types are only ever added, so their count marks staleness
+        values_len, features = self._features_cache
+        if values_len == len(self._values):
+            return features
         features = SUPPORT_OPERATION_MODE
         set_req = self.gateway.const.SetReq
         if set_req.V_HVAC_SPEED in self._values:
@@ -51,6 +58,7 @@ class MySensorsHVAC(mysensors.device.MySensorsEntity, ClimateDevice):
                 SUPPORT_TARGET_TEMPERATURE_LOW)
         else:
             features = features | SUPPORT_TARGET_TEMPERATURE
+        self._features_cache = (len(self._values), features)
         return features
 
     @property
@@ -174,5 +182,7 @@ class MySensorsHVAC(mysensors.device.MySensorsEntity, ClimateDevice):
     async def async_update(self):
         """Update the controller with the latest value from a sensor."""
         await super().async_update()
-        self._values[self.value_type] = DICT_MYS_TO_HA[
-            self._values[self.value_type]]
+        value_type = self.value_type
+        value = self._values[value_type]
+        # Keep values the gateway sends that have no Home Assistant state
+        self._values[value_type] = DICT_MYS_TO_HA.get(value, value)
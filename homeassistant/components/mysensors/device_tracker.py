@@ -44,7 +44,11 @@ class MySensorsDeviceScanner(mysensors.device.MySensorsDevice):
         node = self.gateway.sensors[self.node_id]
         child = node.children[self.child_id]
         position = child.values[self.value_type]
-        latitude, longitude, _ = position.split(',')
+        # Position is "latitude,longitude,altitude", skip the altitude
+        lat_end = position.index(',')
+        lon_end = position.index(',', lat_end + 1)
+        latitude = position[:lat_end]
+        longitude = position[lat_end + 1:lon_end]
 
         await self.async_see(
             dev_id=slugify(self.name),
@@ -21,7 +21,7 @@ class MyStromView(HomeAssistantView):
 
     url = '/api/mystrom'
     name = 'api:mystrom'
-    supported_actions = ['single', 'double', 'long', 'touch']
+    supported_actions = frozenset(('single', 'double', 'long', 'touch'))
 
     def __init__(self, add_entities):
         """Initialize the myStrom URL endpoint."""
@@ -35,9 +35,8 @@ class MyStromView(HomeAssistantView):
 
     async def _handle(self, hass, data):
         """Handle requests to the myStrom endpoint."""
-        button_action = next((
-            parameter for parameter in data
-            if parameter in self.supported_actions), None)
+        button_action = next(
+            iter(self.supported_actions.intersection(data)), None)
 
         if button_action is None:
             _LOGGER.error(
@@ -46,16 +45,16 @@ class MyStromView(HomeAssistantView):
                     HTTP_UNPROCESSABLE_ENTITY)
 
         button_id = data[button_action]
-        entity_id = '{}.{}_{}'.format(DOMAIN, button_id, button_action)
+        name = '{}_{}'.format(button_id, button_action)
+        entity_id = '{}.{}'.format(DOMAIN, name)
         if entity_id not in self.buttons:
             _LOGGER.info("New myStrom button/action detected: %s/%s",
                          button_id, button_action)
-            self.buttons[entity_id] = MyStromBinarySensor(
-                '{}_{}'.format(button_id, button_action))
+            self.buttons[entity_id] = MyStromBinarySensor(name)
             self.add_entities([self.buttons[entity_id]])
         else:
-            new_state = self.buttons[entity_id].state == 'off'
-            self.buttons[entity_id].async_on_update(new_state)
+            button = self.buttons[entity_id]
+            button.async_on_update(not button.is_on)
 
 
 class MyStromBinarySensor(BinarySensorDevice):
@@ -1,4 +1,5 @@
 """Support for Mythic Beasts Dynamic DNS service."""
+from functools import partial
 import logging
 from datetime import timedelta
 
@@ -10,6 +11,7 @@ from homeassistant.const import (
 )
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.event import async_track_time_interval
+import homeassistant.util.dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +19,9 @@ DOMAIN = 'mythicbeastsdns'
 
 DEFAULT_INTERVAL = timedelta(minutes=10)
 
+STORAGE_KEY = DOMAIN
+STORAGE_VERSION = 1
+
 CONFIG_SCHEMA = vol.Schema({
     DOMAIN: vol.Schema({
         vol.Required(CONF_DOMAIN): cv.string,
@@ -38,16 +43,39 @@ async def async_setup(hass, config):
     update_interval = config[DOMAIN][CONF_SCAN_INTERVAL]
 
     session = async_get_clientsession(hass)
+    update = partial(mbddns.update, domain, password, host, session=session)
+    store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+    update_domain = partial(_async_update_domain, update, store, domain, host)
 
-    result = await mbddns.update(domain, password, host, session=session)
+    # After a quick restart the entry is still fresh, leave it to the
+    # interval instead of updating it twice within one interval.
+    last_update = await store.async_load() or {}
+    if not _is_recent(last_update, domain, host, update_interval):
+        if not await update_domain():
+            return False
 
-    if not result:
-        return False
+    async_track_time_interval(hass, update_domain, update_interval)
 
-    async def update_domain_interval(now):
-        """Update the DNS entry."""
-        await mbddns.update(domain, password, host, session=session)
+    return True
 
-    async_track_time_interval(hass, update_domain_interval, update_interval)
 
-    return True
+def _is_recent(last_update, domain, host, update_interval):
+    """Return if the entry was updated within the last interval."""
+    if (last_update.get(CONF_DOMAIN) != domain or
+            last_update.get(CONF_HOST) != host):
+        return False
+    updated = dt_util.parse_datetime(last_update.get('updated', ''))
+    return (updated is not None and
+            dt_util.utcnow() - updated < update_interval)
+
+
+async def _async_update_domain(update, store, domain, host, now=None):
+    """Update the DNS entry and remember when it succeeded."""
+    result = await update()
+    if result:
+        await store.async_save({
+            CONF_DOMAIN: domain,
+            CONF_HOST: host,
+            'updated': dt_util.utcnow().isoformat(),
+        })
+    return result
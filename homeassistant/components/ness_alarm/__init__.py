@@ -29,7 +29,7 @@ DEFAULT_ZONES = []
 DEFAULT_SCAN_INTERVAL = datetime.timedelta(minutes=1)
 DEFAULT_INFER_ARMING_STATE = False
 
-SIGNAL_ZONE_CHANGED = 'ness_alarm.zone_changed'
+SIGNAL_ZONE_CHANGED = 'ness_alarm.zone_changed_{}'
 SIGNAL_ARMING_STATE_CHANGED = 'ness_alarm.arming_state_changed'
 
 ZoneChangedData = namedtuple('ZoneChangedData', ['zone_id', 'state'])
@@ -96,10 +96,11 @@ async def async_setup(hass, config):
 
     def on_zone_change(zone_id: int, state: bool):
         """Receives and propagates zone state updates."""
-        async_dispatcher_send(hass, SIGNAL_ZONE_CHANGED, ZoneChangedData(
-            zone_id=zone_id,
-            state=state,
-        ))
+        async_dispatcher_send(
+            hass, SIGNAL_ZONE_CHANGED.format(zone_id), ZoneChangedData(
+                zone_id=zone_id,
+                state=state,
+            ))
 
     def on_state_change(arming_state: ArmingState):
         """Receives and propagates arming state updates."""
@@ -36,17 +36,20 @@ async def async_setup_platform(hass, config, async_add_entities,
 class NessZoneBinarySensor(BinarySensorDevice):
     """Representation of an Ness alarm zone as a binary sensor."""
 
+    __slots__ = ['_zone_id', '_name', '_type', '_is_on']
+
     def __init__(self, zone_id, name, zone_type):
         """Initialize the binary_sensor."""
         self._zone_id = zone_id
         self._name = name
         self._type = zone_type
-        self._state = 0
+        self._is_on = False
 
     async def async_added_to_hass(self):
         """Register callbacks."""
-        async_dispatcher_connect(
-            self.hass, SIGNAL_ZONE_CHANGED, self._handle_zone_change)
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass, SIGNAL_ZONE_CHANGED.format(self._zone_id),
+            self._handle_zone_change))
 
     @property
     def name(self):
@@ -61,7 +64,7 @@ class NessZoneBinarySensor(BinarySensorDevice):
     @property
     def is_on(self):
         """Return true if sensor is on."""
-        return self._state == 1
+        return self._is_on
 
     @property
     def device_class(self):
@@ -71,6 +74,5 @@ class NessZoneBinarySensor(BinarySensorDevice):
     @callback
     def _handle_zone_change(self, data: ZoneChangedData):
         """Handle zone state update."""
-        if self._zone_id == data.zone_id:
-            self._state = data.state
-            self.async_schedule_update_ha_state()
+        self._is_on = bool(data.state)
+        self.async_write_ha_state()
@@ -10,8 +10,9 @@ from homeassistant.components.climate.const import (
     SUPPORT_OPERATION_MODE, SUPPORT_TARGET_TEMPERATURE,
     SUPPORT_TARGET_TEMPERATURE_HIGH, SUPPORT_TARGET_TEMPERATURE_LOW)
 from homeassistant.const import (
-    ATTR_TEMPERATURE, CONF_SCAN_INTERVAL, STATE_OFF, STATE_ON, TEMP_CELSIUS,
-    TEMP_FAHRENHEIT)
+    ATTR_TEMPERATURE, CONF_SCAN_INTERVAL, EVENT_HOMEASSISTANT_STOP, STATE_OFF,
+    STATE_ON, TEMP_CELSIUS, TEMP_FAHRENHEIT)
+from homeassistant.core import callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 
 from . import DATA_NEST, DOMAIN as NEST_DOMAIN, SIGNAL_NEST_UPDATE
@@ -25,6 +26,14 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend({
 
 NEST_MODE_HEAT_COOL = 'heat-cool'
 
+# Seconds to wait for further target changes before writing to Nest
+TARGET_WRITE_DELAY = 0.3
+
+# Modes that are the same for Nest and Home Assistant
+SHARED_MODES = frozenset((STATE_HEAT, STATE_COOL, STATE_OFF, STATE_ECO))
+# Modes that use a temperature range rather than a single target
+RANGE_MODES = frozenset((NEST_MODE_HEAT_COOL, STATE_ECO))
+
 
 def setup_platform(hass, config, add_entities, discovery_info=None):
     """Set up the Nest thermostat.
@@ -37,23 +46,50 @@ async def async_setup_entry(hass, entry, async_add_entities):
     """Set up the Nest climate device based on a config entry."""
     temp_unit = hass.config.units.temperature_unit
 
-    thermostats = await hass.async_add_job(hass.data[DATA_NEST].thermostats)
+    def get_thermostats():
+        """Get the Nest thermostats."""
+        return [NestThermostat(structure, device, temp_unit)
+                for structure, device in hass.data[DATA_NEST].thermostats()]
 
-    all_devices = [NestThermostat(structure, device, temp_unit)
-                   for structure, device in thermostats]
+    all_devices = await hass.async_add_executor_job(get_thermostats)
 
     async_add_entities(all_devices, True)
 
 
+def _scale_info(scale):
+    """Return unit, key suffix and default min/max for a Nest scale."""
+    from nest.nest import (
+        MAXIMUM_TEMPERATURE_C, MAXIMUM_TEMPERATURE_F, MINIMUM_TEMPERATURE_C,
+        MINIMUM_TEMPERATURE_F)
+
+    if scale == 'C':
+        return (TEMP_CELSIUS, '_c',
+                MINIMUM_TEMPERATURE_C, MAXIMUM_TEMPERATURE_C)
+    return (TEMP_FAHRENHEIT, '_f',
+            MINIMUM_TEMPERATURE_F, MAXIMUM_TEMPERATURE_F)
+
+
 class NestThermostat(ClimateDevice):
     """Representation of a Nest thermostat."""
 
+    __slots__ = ['_api_error', '_unit', 'structure', 'device', '_fan_list',
+                 '_support_flags', '_operation_list', '_has_fan',
+                 '_device_info', '_away', '_location', '_name', '_humidity',
+                 '_target_temperature', '_temperature', '_temperature_scale',
+                 '_mode', '_fan', '_eco_temperature', '_is_locked',
+                 '_locked_temperature', '_min_temperature',
+                 '_max_temperature', '_raw_scale', '_scale_info',
+                 '_pending_target', '_pending_target_handle', '_unique_id']
+
     def __init__(self, structure, device, temp_unit):
         """Initialize the thermostat."""
+        from nest.nest import APIError
+
+        self._api_error = APIError
         self._unit = temp_unit
         self.structure = structure
         self.device = device
-        self._fan_list = [STATE_ON, STATE_AUTO]
+        self._unique_id = device.serial
 
         # Set the default supported features
         self._support_flags = (SUPPORT_TARGET_TEMPERATURE |
@@ -79,9 +115,21 @@ class NestThermostat(ClimateDevice):
 
         # feature of device
         self._has_fan = self.device.has_fan
+        self._fan_list = None
         if self._has_fan:
+            self._fan_list = [STATE_ON, STATE_AUTO]
             self._support_flags = (self._support_flags | SUPPORT_FAN_MODE)
 
+        self._device_info = {
+            'identifiers': {
+                (NEST_DOMAIN, self.device.device_id),
+            },
+            'name': self.device.name_long,
+            'manufacturer': 'Nest Labs',
+            'model': "Thermostat",
+            'sw_version': self.device.software_version,
+        }
+
         # data attributes
         self._away = None
         self._location = None
@@ -97,6 +145,10 @@ class NestThermostat(ClimateDevice):
         self._locked_temperature = None
         self._min_temperature = None
         self._max_temperature = None
+        self._raw_scale = None
+        self._scale_info = None
+        self._pending_target = None
+        self._pending_target_handle = None
 
     @property
     def should_poll(self):
@@ -105,12 +157,19 @@ class NestThermostat(ClimateDevice):
 
     async def async_added_to_hass(self):
         """Register update signal handler."""
-        async def async_update_state():
-            """Update device state."""
-            await self.async_update_ha_state(True)
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass, SIGNAL_NEST_UPDATE, self._async_on_nest_update))
+        self.async_on_remove(self.hass.bus.async_listen(
+            EVENT_HOMEASSISTANT_STOP, self._async_flush_target))
 
-        async_dispatcher_connect(self.hass, SIGNAL_NEST_UPDATE,
-                                 async_update_state)
+    async def async_will_remove_from_hass(self):
+        """Write a pending target before the thermostat goes away."""
+        await self._async_flush_target()
+
+    async def _async_on_nest_update(self):
+        """Update device state from the pushed Nest data."""
+        await self.hass.async_add_executor_job(self.update)
+        self.async_write_ha_state()
 
     @property
     def supported_features(self):
@@ -120,20 +179,12 @@ class NestThermostat(ClimateDevice):
     @property
     def unique_id(self):
         """Return unique ID for this device."""
-        return self.device.serial
+        return self._unique_id
 
     @property
     def device_info(self):
         """Return information about the device."""
-        return {
-            'identifiers': {
-                (NEST_DOMAIN, self.device.device_id),
-            },
-            'name': self.device.name_long,
-            'manufacturer': 'Nest Labs',
-            'model': "Thermostat",
-            'sw_version': self.device.software_version,
-        }
+        return self._device_info
 
     @property
     def name(self):
@@ -153,7 +204,7 @@ class NestThermostat(ClimateDevice):
     @property
     def current_operation(self):
         """Return current operation ie. heat, cool, idle."""
-        if self._mode in [STATE_HEAT, STATE_COOL, STATE_OFF, STATE_ECO]:
+        if self._mode in SHARED_MODES:
             return self._mode
         if self._mode == NEST_MODE_HEAT_COOL:
             return STATE_AUTO
@@ -162,7 +213,7 @@ class NestThermostat(ClimateDevice):
     @property
     def target_temperature(self):
         """Return the temperature we try to reach."""
-        if self._mode not in (NEST_MODE_HEAT_COOL, STATE_ECO):
+        if self._mode not in RANGE_MODES:
             return self._target_temperature
         return None
 
@@ -191,7 +242,6 @@ class NestThermostat(ClimateDevice):
 
     def set_temperature(self, **kwargs):
         """Set new target temperature."""
-        import nest
         temp = None
         target_temp_low = kwargs.get(ATTR_TARGET_TEMP_LOW)
         target_temp_high = kwargs.get(ATTR_TARGET_TEMP_HIGH)
@@ -202,18 +252,51 @@ class NestThermostat(ClimateDevice):
         else:
             temp = kwargs.get(ATTR_TEMPERATURE)
             _LOGGER.debug("Nest set_temperature-output-value=%s", temp)
+        if temp is not None:
+            self.hass.add_job(self._async_schedule_target_write, temp)
+
+    @callback
+    def _async_schedule_target_write(self, temp):
+        """Write the target once changes settle, like moving a slider."""
+        # The pending target is only touched in the event loop
+        self._pending_target = temp
+        if self._pending_target_handle is not None:
+            self._pending_target_handle.cancel()
+        self._pending_target_handle = self.hass.loop.call_later(
+            TARGET_WRITE_DELAY, self._async_write_target)
+
+    @callback
+    def _async_write_target(self):
+        """Write the last requested target from the executor."""
+        self._pending_target_handle = None
+        temp, self._pending_target = self._pending_target, None
+        self.hass.async_add_executor_job(self._write_target, temp)
+
+    async def _async_flush_target(self, event=None):
+        """Write a pending target right away instead of after the delay."""
+        if self._pending_target_handle is None:
+            return
+        self._pending_target_handle.cancel()
+        self._pending_target_handle = None
+        temp, self._pending_target = self._pending_target, None
+        await self.hass.async_add_executor_job(self._write_target, temp)
+
+    def _write_target(self, temp):
+        """Write the target to Nest."""
         try:
-            if temp is not None:
-                self.device.target = temp
-        except nest.nest.APIError as api_error:
+            self.device.target = temp
+        except self._api_error as api_error:
             _LOGGER.error("An error occurred while setting temperature: %s",
                           api_error)
             # restore target temperature
             self.schedule_update_ha_state(True)
+        except Exception:  # pylint: disable=broad-except
+            # Nobody waits for this write, so report any failure here
+            _LOGGER.exception("Unexpected error setting temperature")
 
     def set_operation_mode(self, operation_mode):
         """Set operation mode."""
-        if operation_mode in [STATE_HEAT, STATE_COOL, STATE_OFF, STATE_ECO]:
+        if operation_mode in SHARED_MODES:
             device_mode = operation_mode
         elif operation_mode == STATE_AUTO:
             device_mode = NEST_MODE_HEAT_COOL
@@ -249,9 +332,7 @@ class NestThermostat(ClimateDevice):
     @property
     def fan_list(self):
         """List of available fan modes."""
-        if self._has_fan:
-            return self._fan_list
-        return None
+        return self._fan_list
 
     def set_fan_mode(self, fan_mode):
         """Turn fan on/off."""
@@ -270,20 +351,39 @@ class NestThermostat(ClimateDevice):
 
     def update(self):
         """Cache value from Python-nest."""
+        # Each python-nest property reads the device from the stream status
+        # again, so take one snapshot and read the fields from it.
+        # pylint: disable=protected-access
+        device = self.device._device
+        scale = device.get('temperature_scale')
+        if scale != self._raw_scale:
+            self._raw_scale = scale
+            self._scale_info = _scale_info(scale)
+        (self._temperature_scale, suffix,
+         min_temperature, max_temperature) = self._scale_info
+
         self._location = self.device.where
-        self._name = self.device.name
-        self._humidity = self.device.humidity
-        self._temperature = self.device.temperature
-        self._mode = self.device.mode
-        self._target_temperature = self.device.target
-        self._fan = self.device.fan
-        self._away = self.structure.away == 'away'
-        self._eco_temperature = self.device.eco_temperature
-        self._locked_temperature = self.device.locked_temperature
-        self._min_temperature = self.device.min_temperature
-        self._max_temperature = self.device.max_temperature
-        self._is_locked = self.device.is_locked
-        if self.device.temperature_scale == 'C':
-            self._temperature_scale = TEMP_CELSIUS
+        self._name = device.get('name')
+        self._humidity = device.get('humidity')
+        self._temperature = device.get('ambient_temperature' + suffix)
+        self._mode = device.get('hvac_mode')
+        if self._mode == NEST_MODE_HEAT_COOL:
+            self._target_temperature = (
+                device.get('target_temperature_low' + suffix),
+                device.get('target_temperature_high' + suffix))
         else:
-            self._temperature_scale = TEMP_FAHRENHEIT
+            self._target_temperature = device.get(
+                'target_temperature' + suffix)
+        self._fan = device.get('fan_timer_active')
+        self._away = self.structure.away == 'away'
+        self._eco_temperature = (
+            device.get('eco_temperature_low' + suffix),
+            device.get('eco_temperature_high' + suffix))
+        self._locked_temperature = (
+            device.get('locked_temp_min' + suffix),
+            device.get('locked_temp_max' + suffix))
+        self._is_locked = device.get('is_locked')
+        if self._is_locked:
+            min_temperature, max_temperature = self._locked_temperature
+        self._min_temperature = min_temperature
+        self._max_temperature = max_temperature
@@ -1,8 +1,12 @@
 """Support for the Netatmo Weather Service."""
+import asyncio
 import logging
 import threading
+from bisect import bisect_right
 from datetime import timedelta
-from time import time
+from functools import partial
+from operator import itemgetter
+from time import monotonic, time
 
 import requests
 import voluptuous as vol
@@ -13,8 +17,9 @@ from homeassistant.const import (
     CONF_NAME, CONF_MODE, CONF_MONITORED_CONDITIONS,
     TEMP_CELSIUS, DEVICE_CLASS_HUMIDITY, DEVICE_CLASS_TEMPERATURE,
     DEVICE_CLASS_BATTERY)
+from homeassistant.core import callback
 from homeassistant.helpers.entity import Entity
-from homeassistant.helpers.event import call_later
+from homeassistant.helpers.event import async_call_later
 from homeassistant.util import Throttle
 from .const import DATA_NETATMO_AUTH
 
@@ -44,32 +49,41 @@ SUPPORTED_PUBLIC_SENSOR_TYPES = [
     'guststrength'
 ]
 
+PUBLIC_DATA_GETTERS = {
+    'temperature': 'getLatestTemperatures',
+    'pressure': 'getLatestPressures',
+    'humidity': 'getLatestHumidities',
+    'rain': 'getLatestRain',
+    'windstrength': 'getLatestWindStrengths',
+    'guststrength': 'getLatestGustStrengths',
+}
+
 SENSOR_TYPES = {
-    'temperature': ['Temperature', TEMP_CELSIUS, 'mdi:thermometer',
-                    DEVICE_CLASS_TEMPERATURE],
-    'co2': ['CO2', 'ppm', 'mdi:cloud', None],
-    'pressure': ['Pressure', 'mbar', 'mdi:gauge', None],
-    'noise': ['Noise', 'dB', 'mdi:volume-high', None],
-    'humidity': ['Humidity', '%', 'mdi:water-percent', DEVICE_CLASS_HUMIDITY],
-    'rain': ['Rain', 'mm', 'mdi:weather-rainy', None],
-    'sum_rain_1': ['sum_rain_1', 'mm', 'mdi:weather-rainy', None],
-    'sum_rain_24': ['sum_rain_24', 'mm', 'mdi:weather-rainy', None],
-    'battery_vp': ['Battery', '', 'mdi:battery', None],
-    'battery_lvl': ['Battery_lvl', '', 'mdi:battery', None],
-    'battery_percent': ['battery_percent', '%', None, DEVICE_CLASS_BATTERY],
-    'min_temp': ['Min Temp.', TEMP_CELSIUS, 'mdi:thermometer', None],
-    'max_temp': ['Max Temp.', TEMP_CELSIUS, 'mdi:thermometer', None],
-    'windangle': ['Angle', '', 'mdi:compass', None],
-    'windangle_value': ['Angle Value', 'º', 'mdi:compass', None],
-    'windstrength': ['Wind Strength', 'km/h', 'mdi:weather-windy', None],
-    'gustangle': ['Gust Angle', '', 'mdi:compass', None],
-    'gustangle_value': ['Gust Angle Value', 'º', 'mdi:compass', None],
-    'guststrength': ['Gust Strength', 'km/h', 'mdi:weather-windy', None],
-    'rf_status': ['Radio', '', 'mdi:signal', None],
-    'rf_status_lvl': ['Radio_lvl', '', 'mdi:signal', None],
-    'wifi_status': ['Wifi', '', 'mdi:wifi', None],
-    'wifi_status_lvl': ['Wifi_lvl', 'dBm', 'mdi:wifi', None],
-    'health_idx': ['Health', '', 'mdi:cloud', None],
+    'temperature': ('Temperature', TEMP_CELSIUS, 'mdi:thermometer',
+                    DEVICE_CLASS_TEMPERATURE),
+    'co2': ('CO2', 'ppm', 'mdi:cloud', None),
+    'pressure': ('Pressure', 'mbar', 'mdi:gauge', None),
+    'noise': ('Noise', 'dB', 'mdi:volume-high', None),
+    'humidity': ('Humidity', '%', 'mdi:water-percent', DEVICE_CLASS_HUMIDITY),
+    'rain': ('Rain', 'mm', 'mdi:weather-rainy', None),
+    'sum_rain_1': ('sum_rain_1', 'mm', 'mdi:weather-rainy', None),
+    'sum_rain_24': ('sum_rain_24', 'mm', 'mdi:weather-rainy', None),
+    'battery_vp': ('Battery', '', 'mdi:battery', None),
+    'battery_lvl': ('Battery_lvl', '', 'mdi:battery', None),
+    'battery_percent': ('battery_percent', '%', None, DEVICE_CLASS_BATTERY),
+    'min_temp': ('Min Temp.', TEMP_CELSIUS, 'mdi:thermometer', None),
+    'max_temp': ('Max Temp.', TEMP_CELSIUS, 'mdi:thermometer', None),
+    'windangle': ('Angle', '', 'mdi:compass', None),
+    'windangle_value': ('Angle Value', 'º', 'mdi:compass', None),
+    'windstrength': ('Wind Strength', 'km/h', 'mdi:weather-windy', None),
+    'gustangle': ('Gust Angle', '', 'mdi:compass', None),
+    'gustangle_value': ('Gust Angle Value', 'º', 'mdi:compass', None),
+    'guststrength': ('Gust Strength', 'km/h', 'mdi:weather-windy', None),
+    'rf_status': ('Radio', '', 'mdi:signal', None),
+    'rf_status_lvl': ('Radio_lvl', '', 'mdi:signal', None),
+    'wifi_status': ('Wifi', '', 'mdi:wifi', None),
+    'wifi_status_lvl': ('Wifi_lvl', 'dBm', 'mdi:wifi', None),
+    'health_idx': ('Health', '', 'mdi:cloud', None),
 }
 
 MODULE_SCHEMA = vol.Schema({
@@ -105,7 +119,104 @@ NETATMO_DEVICE_TYPES = {
 }
 
 
-def setup_platform(hass, config, add_entities, discovery_info=None):
+def _no_state(data):
+    """Return no state for data this module does not report."""
+    return None
+
+
+def _rounded(key):
+    """Return an extractor rounding a value to one decimal."""
+    def extract(data):
+        return round(data[key], 1)
+    return extract
+
+
+BATTERY_LABELS = ("Very Low", "Low", "Medium", "High", "Full")
+COMPASS_THRESHOLDS = (0, 30, 60, 120, 150, 210, 240, 300, 330)
+COMPASS_LABELS = (None, "N", "NE", "E", "SE", "S", "SW", "W", "NW", "N")
+SIGNAL_LABELS = ("Full", "High", "Medium", "Low")
+
+
+def _battery_state(low, medium, high, full):
+    """Return an extractor labelling battery_vp by the given thresholds."""
+    thresholds = (low, medium, high, full)
+
+    def extract(data):
+        return BATTERY_LABELS[bisect_right(thresholds, data['battery_vp'])]
+    return extract
+
+
+def _compass_state(key):
+    """Return an extractor labelling an angle with its compass point."""
+    def extract(data):
+        angle = data[key]
+        label = COMPASS_LABELS[bisect_right(COMPASS_THRESHOLDS, angle)]
+        if label is None:
+            return None
+        return "%s (%d\xb0)" % (label, angle)
+    return extract
+
+
+def _signal_state(key, high, medium, low):
+    """Return an extractor labelling a signal level, lower is better."""
+    thresholds = (high, medium, low)
+
+    def extract(data):
+        return SIGNAL_LABELS[bisect_right(thresholds, data[key])]
+    return extract
+
+
+HEALTH_INDEX_STATES = {
+    0: "Healthy",
+    1: "Fine",
+    2: "Fair",
+    3: "Poor",
+    4: "Unhealthy",
+}
+
+
+def _health_state(data):
+    """Return the label of the home coach health index."""
+    return HEALTH_INDEX_STATES.get(data['health_idx'])
+
+
+SENSOR_EXTRACTORS = {
+    'temperature': _rounded('Temperature'),
+    'humidity': itemgetter('Humidity'),
+    'rain': itemgetter('Rain'),
+    'sum_rain_1': itemgetter('sum_rain_1'),
+    'sum_rain_24': itemgetter('sum_rain_24'),
+    'noise': itemgetter('Noise'),
+    'co2': itemgetter('CO2'),
+    'pressure': _rounded('Pressure'),
+    'battery_percent': itemgetter('battery_percent'),
+    'battery_lvl': itemgetter('battery_vp'),
+    'min_temp': itemgetter('min_temp'),
+    'max_temp': itemgetter('max_temp'),
+    'windangle_value': itemgetter('WindAngle'),
+    'windangle': _compass_state('WindAngle'),
+    'windstrength': itemgetter('WindStrength'),
+    'gustangle_value': itemgetter('GustAngle'),
+    'gustangle': _compass_state('GustAngle'),
+    'guststrength': itemgetter('GustStrength'),
+    'rf_status_lvl': itemgetter('rf_status'),
+    'rf_status': _signal_state('rf_status', 60, 76, 90),
+    'wifi_status_lvl': itemgetter('wifi_status'),
+    'wifi_status': _signal_state('wifi_status', 56, 71, 86),
+    'health_idx': _health_state,
+}
+
+# The battery_vp thresholds depend on the module type
+BATTERY_VP_EXTRACTORS = {
+    MODULE_TYPE_WIND: _battery_state(4360, 4770, 5180, 5590),
+    MODULE_TYPE_RAIN: _battery_state(4000, 4500, 5000, 5500),
+    MODULE_TYPE_INDOOR: _battery_state(4560, 4920, 5280, 5640),
+    MODULE_TYPE_OUTDOOR: _battery_state(4000, 4500, 5000, 5500),
+}
+
+
+async def async_setup_platform(hass, config, async_add_entities,
+                               discovery_info=None):
     """Set up the available Netatmo weather sensors."""
     dev = []
     auth = hass.data[DATA_NETATMO_AUTH]
@@ -117,7 +228,8 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
                 lat_ne=area[CONF_LAT_NE],
                 lon_ne=area[CONF_LON_NE],
                 lat_sw=area[CONF_LAT_SW],
-                lon_sw=area[CONF_LON_SW]
+                lon_sw=area[CONF_LON_SW],
+                monitored_conditions=area[CONF_MONITORED_CONDITIONS]
             )
             for sensor_type in area[CONF_MONITORED_CONDITIONS]:
                 dev.append(NetatmoPublicSensor(
@@ -127,20 +239,28 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
                     area[CONF_MODE]
                 ))
     else:
-        def _retry(_data):
+        @callback
+        def _retry(_data, _now=None):
             try:
                 _dev = find_devices(_data)
             except requests.exceptions.Timeout:
-                return call_later(hass, NETATMO_UPDATE_INTERVAL,
-                                  lambda _: _retry(_data))
+                async_call_later(hass, NETATMO_UPDATE_INTERVAL,
+                                 partial(_retry, _data))
+                return
             if _dev:
-                add_entities(_dev, True)
+                async_add_entities(_dev, True)
 
         import pyatmo
-        for data_class in [pyatmo.WeatherStationData, pyatmo.HomeCoachData]:
-            try:
-                data = NetatmoData(auth, data_class, config.get(CONF_STATION))
-            except pyatmo.NoDevice:
+        station = config.get(CONF_STATION)
+        data_classes = [pyatmo.WeatherStationData, pyatmo.HomeCoachData]
+        # Fetch the weather station and home coach data side by side
+        all_data = await asyncio.gather(*[
+            hass.async_add_executor_job(
+                _get_netatmo_data, auth, data_class, station)
+            for data_class in data_classes])
+
+        for data_class, data in zip(data_classes, all_data):
+            if data is None:
                 _LOGGER.warning(
                     "No %s devices found",
                     NETATMO_DEVICE_TYPES[data_class.__name__]
@@ -155,19 +275,27 @@ def setup_platform(hass, config, add_entities, discovery_info=None):
                         continue
                     for condition in monitored_conditions:
                         dev.append(NetatmoSensor(
-                            data, module_name, condition.lower(),
-                            config.get(CONF_STATION)))
+                            data, module_name, condition.lower(), station))
                 continue
 
             # otherwise add all modules and conditions
             try:
                 dev.extend(find_devices(data))
             except requests.exceptions.Timeout:
-                call_later(hass, NETATMO_UPDATE_INTERVAL,
-                           lambda _: _retry(data))
+                async_call_later(hass, NETATMO_UPDATE_INTERVAL,
+                                 partial(_retry, data))
 
     if dev:
-        add_entities(dev, True)
+        async_add_entities(dev, True)
+
+
+def _get_netatmo_data(auth, data_class, station):
+    """Return the data object for a device class, None without devices."""
+    import pyatmo
+    try:
+        return NetatmoData(auth, data_class, station)
+    except pyatmo.NoDevice:
+        return None
 
 
 def find_devices(data):
@@ -186,21 +314,26 @@ class NetatmoSensor(Entity):
 
     def __init__(self, netatmo_data, module_name, sensor_type, station):
         """Initialize the sensor."""
-        self._name = 'Netatmo {} {}'.format(module_name,
-                                            SENSOR_TYPES[sensor_type][0])
+        name, unit, icon, device_class = SENSOR_TYPES[sensor_type]
+        self._name = 'Netatmo {} {}'.format(module_name, name)
         self.netatmo_data = netatmo_data
         self.module_name = module_name
         self.type = sensor_type
         self.station_name = station
         self._state = None
-        self._device_class = SENSOR_TYPES[self.type][3]
-        self._icon = SENSOR_TYPES[self.type][2]
-        self._unit_of_measurement = SENSOR_TYPES[self.type][1]
+        self._device_class = device_class
+        self._icon = icon
+        self._unit_of_measurement = unit
         module = self.netatmo_data.station_data.moduleByName(
             station=self.station_name, module=module_name
         )
         self._module_type = module['type']
         self._unique_id = '{}-{}'.format(module['_id'], self.type)
+        if sensor_type == 'battery_vp':
+            self._extractor = BATTERY_VP_EXTRACTORS.get(
+                self._module_type, _no_state)
+        else:
+            self._extractor = SENSOR_EXTRACTORS[sensor_type]
 
     @property
     def name(self):
@@ -250,157 +383,7 @@ class NetatmoSensor(Entity):
             return
 
         try:
-            if self.type == 'temperature':
-                self._state = round(data['Temperature'], 1)
-            elif self.type == 'humidity':
-                self._state = data['Humidity']
-            elif self.type == 'rain':
-                self._state = data['Rain']
-            elif self.type == 'sum_rain_1':
-                self._state = data['sum_rain_1']
-            elif self.type == 'sum_rain_24':
-                self._state = data['sum_rain_24']
-            elif self.type == 'noise':
-                self._state = data['Noise']
-            elif self.type == 'co2':
-                self._state = data['CO2']
-            elif self.type == 'pressure':
-                self._state = round(data['Pressure'], 1)
-            elif self.type == 'battery_percent':
-                self._state = data['battery_percent']
-            elif self.type == 'battery_lvl':
-                self._state = data['battery_vp']
-            elif (self.type == 'battery_vp' and
-                  self._module_type == MODULE_TYPE_WIND):
-                if data['battery_vp'] >= 5590:
-                    self._state = "Full"
-                elif data['battery_vp'] >= 5180:
-                    self._state = "High"
-                elif data['battery_vp'] >= 4770:
-                    self._state = "Medium"
-                elif data['battery_vp'] >= 4360:
-                    self._state = "Low"
-                elif data['battery_vp'] < 4360:
-                    self._state = "Very Low"
-            elif (self.type == 'battery_vp' and
-                  self._module_type == MODULE_TYPE_RAIN):
-                if data['battery_vp'] >= 5500:
-                    self._state = "Full"
-                elif data['battery_vp'] >= 5000:
-                    self._state = "High"
-                elif data['battery_vp'] >= 4500:
-                    self._state = "Medium"
-                elif data['battery_vp'] >= 4000:
-                    self._state = "Low"
-                elif data['battery_vp'] < 4000:
-                    self._state = "Very Low"
-            elif (self.type == 'battery_vp' and
-                  self._module_type == MODULE_TYPE_INDOOR):
-                if data['battery_vp'] >= 5640:
-                    self._state = "Full"
-                elif data['battery_vp'] >= 5280:
-                    self._state = "High"
-                elif data['battery_vp'] >= 4920:
-                    self._state = "Medium"
-                elif data['battery_vp'] >= 4560:
-                    self._state = "Low"
-                elif data['battery_vp'] < 4560:
-                    self._state = "Very Low"
-            elif (self.type == 'battery_vp' and
-                  self._module_type == MODULE_TYPE_OUTDOOR):
-                if data['battery_vp'] >= 5500:
-                    self._state = "Full"
-                elif data['battery_vp'] >= 5000:
-                    self._state = "High"
-                elif data['battery_vp'] >= 4500:
-                    self._state = "Medium"
-                elif data['battery_vp'] >= 4000:
-                    self._state = "Low"
-                elif data['battery_vp'] < 4000:
-                    self._state = "Very Low"
-            elif self.type == 'min_temp':
-                self._state = data['min_temp']
-            elif self.type == 'max_temp':
-                self._state = data['max_temp']
-            elif self.type == 'windangle_value':
-                self._state = data['WindAngle']
-            elif self.type == 'windangle':
-                if data['WindAngle'] >= 330:
-                    self._state = "N (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 300:
-                    self._state = "NW (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 240:
-                    self._state = "W (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 210:
-                    self._state = "SW (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 150:
-                    self._state = "S (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 120:
-                    self._state = "SE (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 60:
-                    self._state = "E (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 30:
-                    self._state = "NE (%d\xb0)" % data['WindAngle']
-                elif data['WindAngle'] >= 0:
-                    self._state = "N (%d\xb0)" % data['WindAngle']
-            elif self.type == 'windstrength':
-                self._state = data['WindStrength']
-            elif self.type == 'gustangle_value':
-                self._state = data['GustAngle']
-            elif self.type == 'gustangle':
-                if data['GustAngle'] >= 330:
-                    self._state = "N (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 300:
-                    self._state = "NW (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 240:
-                    self._state = "W (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 210:
-                    self._state = "SW (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 150:
-                    self._state = "S (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 120:
-                    self._state = "SE (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 60:
-                    self._state = "E (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 30:
-                    self._state = "NE (%d\xb0)" % data['GustAngle']
-                elif data['GustAngle'] >= 0:
-                    self._state = "N (%d\xb0)" % data['GustAngle']
-            elif self.type == 'guststrength':
-                self._state = data['GustStrength']
-            elif self.type == 'rf_status_lvl':
-                self._state = data['rf_status']
-            elif self.type == 'rf_status':
-                if data['rf_status'] >= 90:
-                    self._state = "Low"
-                elif data['rf_status'] >= 76:
-                    self._state = "Medium"
-                elif data['rf_status'] >= 60:
-                    self._state = "High"
-                elif data['rf_status'] <= 59:
-                    self._state = "Full"
-            elif self.type == 'wifi_status_lvl':
-                self._state = data['wifi_status']
-            elif self.type == 'wifi_status':
-                if data['wifi_status'] >= 86:
-                    self._state = "Low"
-                elif data['wifi_status'] >= 71:
-                    self._state = "Medium"
-                elif data['wifi_status'] >= 56:
-                    self._state = "High"
-                elif data['wifi_status'] <= 55:
-                    self._state = "Full"
-            elif self.type == 'health_idx':
-                if data['health_idx'] == 0:
-                    self._state = "Healthy"
-                elif data['health_idx'] == 1:
-                    self._state = "Fine"
-                elif data['health_idx'] == 2:
-                    self._state = "Fair"
-                elif data['health_idx'] == 3:
-                    self._state = "Poor"
-                elif data['health_idx'] == 4:
-                    self._state = "Unhealthy"
+            self._state = self._extractor(data)
         except KeyError:
             _LOGGER.error("No %s data found for %s", self.type,
                           self.module_name)
@@ -416,13 +399,13 @@ class NetatmoPublicSensor(Entity):
         self.netatmo_data = data
         self.type = sensor_type
         self._mode = mode
-        self._name = '{} {}'.format(area_name,
-                                    SENSOR_TYPES[self.type][0])
+        name, unit, icon, device_class = SENSOR_TYPES[sensor_type]
+        self._name = '{} {}'.format(area_name, name)
         self._area_name = area_name
         self._state = None
-        self._device_class = SENSOR_TYPES[self.type][3]
-        self._icon = SENSOR_TYPES[self.type][2]
-        self._unit_of_measurement = SENSOR_TYPES[self.type][1]
+        self._device_class = device_class
+        self._icon = icon
+        self._unit_of_measurement = unit
 
     @property
     def name(self):
@@ -458,20 +441,7 @@ class NetatmoPublicSensor(Entity):
             self._state = None
             return
 
-        data = None
-
-        if self.type == 'temperature':
-            data = self.netatmo_data.data.getLatestTemperatures()
-        elif self.type == 'pressure':
-            data = self.netatmo_data.data.getLatestPressures()
-        elif self.type == 'humidity':
-            data = self.netatmo_data.data.getLatestHumidities()
-        elif self.type == 'rain':
-            data = self.netatmo_data.data.getLatestRain()
-        elif self.type == 'windstrength':
-            data = self.netatmo_data.data.getLatestWindStrengths()
-        elif self.type == 'guststrength':
-            data = self.netatmo_data.data.getLatestGustStrengths()
+        data = self.netatmo_data.latest.get(self.type)
 
         if not data:
             _LOGGER.warning("No station provides %s data in the area %s",
@@ -479,19 +449,20 @@ class NetatmoPublicSensor(Entity):
             self._state = None
             return
 
-        if self._mode == 'avg':
-            self._state = round(sum(data.values()) / len(data), 1)
-        elif self._mode == 'max':
-            self._state = max(data.values())
+        self._state = self.netatmo_data.aggregate(self.type, self._mode)
 
 
 class NetatmoPublicData:
     """Get the latest data from Netatmo."""
 
-    def __init__(self, auth, lat_ne, lon_ne, lat_sw, lon_sw):
+    def __init__(self, auth, lat_ne, lon_ne, lat_sw, lon_sw,
+                 monitored_conditions):
         """Initialize the data object."""
         self.auth = auth
         self.data = None
+        self.latest = {}
+        self.monitored_conditions = monitored_conditions
+        self._aggregates = {}
         self.lat_ne = lat_ne
         self.lon_ne = lon_ne
         self.lat_sw = lat_sw
@@ -513,6 +484,22 @@ class NetatmoPublicData:
             return
 
         self.data = data
+        # Read the station values once per fetch instead of on every poll
+        self.latest = {
+            sensor_type: getattr(data, PUBLIC_DATA_GETTERS[sensor_type])()
+            for sensor_type in self.monitored_conditions}
+        self._aggregates = {}
+
+    def aggregate(self, sensor_type, mode):
+        """Return the avg or max of a sensor type, computed once per fetch."""
+        key = (sensor_type, mode)
+        if key not in self._aggregates:
+            values = self.latest[sensor_type].values()
+            if mode == 'avg':
+                self._aggregates[key] = round(sum(values) / len(values), 1)
+            else:
+                self._aggregates[key] = max(values)
+        return self._aggregates[key]
 
 
 class NetatmoData:
@@ -524,8 +511,10 @@ class NetatmoData:
         self.data_class = data_class
         self.data = {}
         self.station_data = self.data_class(self.auth)
+        # The station data fetched above serves the first update
+        self._station_data_fresh = True
         self.station = station
-        self._next_update = time()
+        self._next_update = monotonic()
         self._update_in_progress = threading.Lock()
 
     def get_module_names(self):
@@ -541,13 +530,16 @@ class NetatmoData:
         but with a custom logic, which takes into account the time
         of the last update from the cloud.
         """
-        if time() < self._next_update or \
+        if monotonic() < self._next_update or \
                 not self._update_in_progress.acquire(False):
             return
         try:
             from pyatmo import NoDevice
             try:
-                self.station_data = self.data_class(self.auth)
+                if self._station_data_fresh:
+                    self._station_data_fresh = False
+                else:
+                    self.station_data = self.data_class(self.auth)
                 _LOGGER.debug("%s detected!", str(self.data_class.__name__))
             except NoDevice:
                 _LOGGER.warning("No Weather or HomeCoach devices found for %s",
@@ -564,7 +556,7 @@ class NetatmoData:
             else:
                 data = self.station_data.lastData(exclude=3600)
             if not data:
-                self._next_update = time() + NETATMO_UPDATE_INTERVAL
+                self._next_update = monotonic() + NETATMO_UPDATE_INTERVAL
                 return
             self.data = data
 
@@ -594,6 +586,6 @@ class NetatmoData:
                 # Last update time not found, fall back to default value
                 newinterval = NETATMO_UPDATE_INTERVAL
 
-            self._next_update = time() + newinterval
+            self._next_update = monotonic() + newinterval
         finally:
             self._update_in_progress.release()
@@ -7,11 +7,12 @@ import voluptuous as vol
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     CONF_HOST, CONF_ICON, CONF_NAME, CONF_PORT, CONF_RESOURCES)
+from homeassistant.core import callback
 from homeassistant.exceptions import PlatformNotReady
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
-from homeassistant.util import Throttle
+from homeassistant.helpers.event import async_track_time_interval
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -79,6 +80,10 @@ async def async_setup_platform(
 
     async_add_entities(dev, True)
 
+    # One request per interval feeds all sensors of this host
+    async_track_time_interval(
+        hass, netdata.async_update, MIN_TIME_BETWEEN_UPDATES)
+
 
 class NetdataSensor(Entity):
     """Implementation of a Netdata sensor."""
@@ -123,9 +128,28 @@ class NetdataSensor(Entity):
         """Could the resource be accessed during the last update call."""
         return self.netdata.available
 
+    @property
+    def should_poll(self):
+        """No polling needed, the shared data object pushes updates."""
+        return False
+
+    async def async_added_to_hass(self):
+        """Register for data updates."""
+        self.async_on_remove(
+            self.netdata.async_add_listener(self._async_data_updated))
+
+    @callback
+    def _async_data_updated(self):
+        """Update the state from the latest fetch."""
+        self._update_state()
+        self.async_write_ha_state()
+
     async def async_update(self):
         """Get the latest data from Netdata REST API."""
-        await self.netdata.async_update()
+        self._update_state()
+
+    def _update_state(self):
+        """Read the state from the metrics of the last fetch."""
         resource_data = self.netdata.api.metrics.get(self._sensor)
         self._state = round(
             resource_data['dimensions'][self._element]['value'], 2) \
@@ -139,9 +163,21 @@ class NetdataData:
         """Initialize the data object."""
         self.api = api
         self.available = True
+        self._listeners = []
 
-    @Throttle(MIN_TIME_BETWEEN_UPDATES)
-    async def async_update(self):
+    @callback
+    def async_add_listener(self, update_callback):
+        """Call update_callback after each fetch, return a remover."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener():
+            """Stop calling update_callback."""
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    async def async_update(self, now=None):
         """Get the latest data from the Netdata REST API."""
         from netdata.exceptions import NetdataError
 
@@ -151,3 +187,6 @@ class NetdataData:
         except NetdataError:
             _LOGGER.error("Unable to retrieve data from Netdata")
             self.available = False
+
+        for update_callback in list(self._listeners):
+            update_callback()
@@ -186,9 +186,10 @@ class EntityComponent:
     def async_register_entity_service(self, name, schema, func,
                                       required_features=None):
         """Register an entity service."""
+        service_name = "{}.{}".format(self.domain, name)
+
         async def handle_service(call):
             """Handle the service."""
-            service_name = "{}.{}".format(self.domain, name)
             await self.hass.helpers.service.entity_service_call(
                 self._platforms.values(), func, call, service_name,
                 required_features
@@ -4,6 +4,8 @@ from collections import namedtuple
 
 from homeassistant.components import weather
 from homeassistant.components.weather import (
+    ATTR_FORECAST, ATTR_FORECAST_CONDITION, ATTR_FORECAST_PRECIPITATION,
+    ATTR_FORECAST_TEMP, ATTR_FORECAST_TEMP_LOW, ATTR_FORECAST_TIME,
     ATTR_WEATHER_HUMIDITY, ATTR_WEATHER_PRESSURE, ATTR_WEATHER_TEMPERATURE,
     ATTR_WEATHER_WIND_BEARING, ATTR_WEATHER_WIND_SPEED,
     DOMAIN as WEATHER_DOMAIN)
@@ -81,6 +83,13 @@ async def test_setup_configuration(hass):
     assert data.get(ATTR_WEATHER_WIND_BEARING) == 'NW'
     assert state.attributes.get('friendly_name') == 'HomeTown'
 
+    forecast = data.get(ATTR_FORECAST)[0]
+    assert forecast.get(ATTR_FORECAST_CONDITION) == 'rainy'
+    assert forecast.get(ATTR_FORECAST_TEMP) == 18.7
+    assert forecast.get(ATTR_FORECAST_TEMP_LOW) == 13.7
+    assert forecast.get(ATTR_FORECAST_TIME) == '2018-05-31'
+    assert forecast.get(ATTR_FORECAST_PRECIPITATION) == 73.0
+
 
 async def test_setup_config_flow(hass):
     """Test for successfully setting up the IPMA platform."""
@@ -3,7 +3,6 @@
 import unittest
 import unittest.mock as mock
 import os
-from io import StringIO
 
 import pytest
 
@@ -366,28 +365,16 @@ class TestLight(unittest.TestCase):
         platform.init()
 
         user_light_file = self.hass.config.path(light.LIGHT_PROFILES_FILE)
-        real_isfile = os.path.isfile
-        real_open = open
-
-        def _mock_isfile(path):
-            if path == user_light_file:
-                return True
-            return real_isfile(path)
-
-        def _mock_open(path, *args, **kwargs):
-            if path == user_light_file:
-                return StringIO(profile_data)
-            return real_open(path, *args, **kwargs)
-
-        profile_data = "id,x,y,brightness\n" +\
-                       "group.all_lights.default,.4,.6,99\n"
-        with mock.patch('os.path.isfile', side_effect=_mock_isfile):
-            with mock.patch('builtins.open', side_effect=_mock_open):
-                with mock_storage():
-                    assert setup_component(
-                        self.hass, light.DOMAIN,
-                        {light.DOMAIN: {CONF_PLATFORM: 'test'}}
-                    )
+
+        with open(user_light_file, 'w') as user_file:
+            user_file.write('id,x,y,brightness\n')
+            user_file.write('group.all_lights.default,.4,.6,99\n')
+
+        with mock_storage():
+            assert setup_component(
+                self.hass, light.DOMAIN,
+                {light.DOMAIN: {CONF_PLATFORM: 'test'}}
+            )
 
         dev, _, _ = platform.DEVICES
         common.turn_on(self.hass, dev.entity_id)
@@ -404,29 +391,17 @@ class TestLight(unittest.TestCase):
         platform.init()
 
         user_light_file = self.hass.config.path(light.LIGHT_PROFILES_FILE)
-        real_isfile = os.path.isfile
-        real_open = open
-
-        def _mock_isfile(path):
-            if path == user_light_file:
-                return True
-            return real_isfile(path)
-
-        def _mock_open(path, *args, **kwargs):
-            if path == user_light_file:
-                return StringIO(profile_data)
-            return real_open(path, *args, **kwargs)
-
-        profile_data = "id,x,y,brightness\n" +\
-                       "group.all_lights.default,.3,.5,200\n" +\
-                       "light.ceiling_2.default,.6,.6,100\n"
-        with mock.patch('os.path.isfile', side_effect=_mock_isfile):
-            with mock.patch('builtins.open', side_effect=_mock_open):
-                with mock_storage():
-                    assert setup_component(
-                        self.hass, light.DOMAIN,
-                        {light.DOMAIN: {CONF_PLATFORM: 'test'}}
-                    )
+
+        with open(user_light_file, 'w') as user_file:
+            user_file.write('id,x,y,brightness\n')
+            user_file.write('group.all_lights.default,.3,.5,200\n')
+            user_file.write('light.ceiling_2.default,.6,.6,100\n')
+
+        with mock_storage():
+            assert setup_component(
+                self.hass, light.DOMAIN,
+                {light.DOMAIN: {CONF_PLATFORM: 'test'}}
+            )
 
         dev = next(filter(lambda x: x.entity_id == 'light.ceiling_2',
                           platform.DEVICES))
@@ -567,3 +542,45 @@ async def test_light_turn_on_auth(hass, hass_admin_user):
         await hass.services.async_call('light', 'turn_on', {
             'entity_id': state.entity_id,
         }, True, core.Context(user_id=hass_admin_user.id))
+
+
+async def test_light_profiles_cached(hass):
+    """Test unchanged profile files are not parsed again."""
+    light._PROFILES_CACHE.clear()
+
+    with mock.patch('homeassistant.components.light._parse_profile_row',
+                    wraps=light._parse_profile_row) as mock_parse:
+        assert await light.Profiles.load_profiles(hass)
+        parsed_rows = mock_parse.call_count
+        assert await light.Profiles.load_profiles(hass)
+
+    assert parsed_rows > 0
+    assert mock_parse.call_count == parsed_rows
+    assert light.Profiles.get('relax') == (35.932, 69.412, 144)
+
+
+def test_light_color_conversions_cached():
+    """Test hs color conversions are reused while the color is unchanged."""
+    class MockColorLight(light.Light):
+        """Mock color light."""
+
+        hs_color = (30, 50)
+        is_on = True
+        supported_features = light.SUPPORT_COLOR
+
+    mock_light = MockColorLight()
+
+    with mock.patch('homeassistant.util.color.color_hs_to_RGB',
+                    wraps=light.color_util.color_hs_to_RGB) as mock_rgb:
+        attrs = mock_light.state_attributes
+        assert mock_light.state_attributes == attrs
+        assert mock_rgb.call_count == 1
+
+        mock_light.hs_color = (60, 50)
+        attrs = mock_light.state_attributes
+        assert mock_rgb.call_count == 2
+
+    assert attrs[light.ATTR_HS_COLOR] == (60, 50)
+    assert attrs[light.ATTR_RGB_COLOR] == (255, 255, 127)
+    assert attrs[light.ATTR_XY_COLOR] == \
+        light.color_util.color_hs_to_xy(60, 50)
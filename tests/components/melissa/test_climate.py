@@ -317,6 +317,19 @@ async def test_send(hass):
         assert thermostat._cur_settings is None
 
 
+async def test_send_failed_restores_settings(hass):
+    """Test that a failed send restores the previous settings."""
+    with patch('homeassistant.components.melissa'):
+        api = melissa_mock()
+        device = (await api.async_fetch_devices())[_SERIAL]
+        thermostat = MelissaClimate(api, _SERIAL, device)
+        await thermostat.async_update()
+        old_settings = dict(thermostat._cur_settings)
+        api.async_send = mock_coro_func(return_value=False)
+        await thermostat.async_send({'fan': api.FAN_LOW, 'unknown': 1})
+        assert thermostat._cur_settings == old_settings
+
+
 async def test_update(hass):
     """Test update."""
     with patch('homeassistant.components.melissa.climate._LOGGER.warning'
@@ -1,4 +1,5 @@
 """The tests for the mFi sensor platform."""
+import asyncio
 import unittest
 import unittest.mock as mock
 
@@ -9,7 +10,7 @@ import homeassistant.components.sensor as sensor
 import homeassistant.components.mfi.sensor as mfi
 from homeassistant.const import TEMP_CELSIUS
 
-from tests.common import get_test_home_assistant
+from tests.common import get_test_home_assistant, mock_coro
 
 
 class TestMfiSensorSetup(unittest.TestCase):
@@ -115,8 +116,8 @@ class TestMfiSensorSetup(unittest.TestCase):
         assert setup_component(self.hass, sensor.DOMAIN, self.GOOD_CONFIG)
         for ident, port in ports.items():
             if ident != 'bad':
-                mock_sensor.assert_any_call(port, self.hass)
-        assert mock.call(ports['bad'], self.hass) not in mock_sensor.mock_calls
+                mock_sensor.assert_any_call(port, mock.ANY)
+        assert mock.call(ports['bad'], mock.ANY) not in mock_sensor.mock_calls
 
 
 class TestMfiSensor(unittest.TestCase):
@@ -126,7 +127,8 @@ class TestMfiSensor(unittest.TestCase):
         """Set up things to be run when tests are started."""
         self.hass = get_test_home_assistant()
         self.port = mock.MagicMock()
-        self.sensor = mfi.MfiSensor(self.port, self.hass)
+        self.data = mock.MagicMock()
+        self.sensor = mfi.MfiSensor(self.port, self.data)
 
     def teardown_method(self, method):
         """Stop everything that was started."""
@@ -185,8 +187,44 @@ class TestMfiSensor(unittest.TestCase):
         type(self.port).tag = mock.PropertyMock(side_effect=ValueError)
         assert mfi.STATE_OFF == self.sensor.state
 
+    def _update(self, *sensors):
+        """Update sensors concurrently, like the entity platform does."""
+        async def update():
+            await asyncio.gather(*(sensor.async_update()
+                                   for sensor in sensors))
+
+        asyncio.run_coroutine_threadsafe(update(), self.hass.loop).result()
+
     def test_update(self):
         """Test the update."""
-        self.sensor.update()
+        info = {'_id': self.port.ident, 'tag': 'temperature'}
+        self.data.sensors = {self.port.ident: info}
+        self.data.async_update.return_value = mock_coro()
+        self._update(self.sensor)
+        assert self.data.async_update.call_count == 1
         assert self.port.refresh.call_count == 1
-        assert self.port.refresh.call_args == mock.call()
+        assert self.port.refresh.call_args == mock.call(info)
+
+    def test_update_unknown_port(self):
+        """Test the update keeps old data for ports missing from the list."""
+        self.data.sensors = {}
+        self.data.async_update.return_value = mock_coro()
+        self._update(self.sensor)
+        assert self.port.refresh.call_count == 0
+
+    def test_update_shares_request(self):
+        """Test that sensors share a single sensor listing."""
+        client = mock.MagicMock()
+        client.get_raw_sensors.return_value = [
+            {'_id': 'a', 'tag': 'temperature'},
+            {'_id': 'b', 'tag': 'active_pwr'},
+        ]
+        mfi_data = mfi.MfiData(self.hass, client)
+        ports = [mock.MagicMock(ident='a'), mock.MagicMock(ident='b')]
+        sensors = [mfi.MfiSensor(port, mfi_data) for port in ports]
+        self._update(*sensors)
+        assert client.get_raw_sensors.call_count == 1
+        assert ports[0].refresh.call_args == \
+            mock.call({'_id': 'a', 'tag': 'temperature'})
+        assert ports[1].refresh.call_args == \
+            mock.call({'_id': 'b', 'tag': 'active_pwr'})
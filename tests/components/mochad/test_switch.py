@@ -61,6 +61,7 @@ class TestMochadSwitch(unittest.TestCase):
         """Set up things to be run when tests are started."""
         self.hass = get_test_home_assistant()
         controller_mock = mock.MagicMock()
+        controller_mock.socket.recv.side_effect = BlockingIOError
         dev_dict = {'address': 'a1', 'name': 'fake_switch'}
         self.switch = mochad.MochadSwitch(self.hass, controller_mock,
                                           dev_dict)
@@ -82,3 +83,15 @@ class TestMochadSwitch(unittest.TestCase):
         """Test turn_off."""
         self.switch.turn_off()
         self.switch.switch.send_cmd.assert_called_once_with('off')
+
+    def test_reuses_open_connection(self):
+        """Test that commands reuse a connection that is still open."""
+        self.switch.turn_on()
+        assert not self.switch._controller.reconnect.called
+
+    def test_reconnects_closed_connection(self):
+        """Test that commands reconnect once mochad closed the socket."""
+        self.switch._controller.socket.recv.side_effect = [b'event', b'']
+        self.switch.turn_on()
+        assert self.switch._controller.reconnect.call_count == 1
+        self.switch.switch.send_cmd.assert_called_once_with('on')
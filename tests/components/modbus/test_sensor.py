@@ -0,0 +1,113 @@
+"""The tests for the Modbus sensor platform."""
+from unittest.mock import MagicMock
+
+from homeassistant.components.modbus import DOMAIN
+from homeassistant.components.modbus import sensor as modbus
+
+
+def _setup_sensors(hass, hub, registers):
+    """Set up Modbus sensors for the given registers on hub."""
+    hass.data[DOMAIN] = {'default': hub}
+    entities = []
+    modbus.setup_platform(
+        hass, modbus.PLATFORM_SCHEMA({
+            'platform': 'modbus',
+            'registers': registers,
+        }), entities.extend)
+    return entities
+
+
+def _response(registers):
+    """Return a read response carrying registers."""
+    return MagicMock(spec=['registers'], registers=registers)
+
+
+def _error(exception_code):
+    """Return a Modbus exception response."""
+    return MagicMock(spec=['exception_code'], exception_code=exception_code)
+
+
+def test_merged_read(hass):
+    """Test neighbouring sensors share one read of their registers."""
+    hub = MagicMock()
+    hub.read_holding_registers.return_value = _response(
+        [1, 0, 0, 0, 0, 2, 3])
+    sensors = _setup_sensors(hass, hub, [
+        {'name': 'first', 'register': 0},
+        {'name': 'second', 'register': 5, 'count': 2, 'data_type': 'uint'},
+    ])
+
+    for sensor in sensors:
+        sensor.update()
+
+    hub.read_holding_registers.assert_called_once_with(None, 0, 7)
+    assert sensors[0].state == '1'
+    assert sensors[1].state == str(2 * 65536 + 3)
+
+    for sensor in sensors:
+        sensor.update()
+
+    assert hub.read_holding_registers.call_count == 2
+
+
+def test_distant_registers_not_merged(hass):
+    """Test sensors far apart are read separately."""
+    hub = MagicMock()
+    hub.read_input_registers.return_value = _response([4])
+    sensors = _setup_sensors(hass, hub, [
+        {'name': 'first', 'register': 0, 'register_type': 'input'},
+        {'name': 'second', 'register': 100, 'register_type': 'input'},
+    ])
+
+    for sensor in sensors:
+        sensor.update()
+
+    assert hub.read_input_registers.call_count == 2
+    assert [sensor.state for sensor in sensors] == ['4', '4']
+
+
+def test_illegal_address_reads_separately(hass):
+    """Test a slave refusing the merged read is read per sensor."""
+    hub = MagicMock()
+    hub.read_holding_registers.side_effect = [
+        _error(modbus.EXCEPTION_ILLEGAL_ADDRESS),
+        _response([1]), _response([2]), _response([3]), _response([4]),
+    ]
+    sensors = _setup_sensors(hass, hub, [
+        {'name': 'first', 'register': 0},
+        {'name': 'second', 'register': 5},
+    ])
+
+    for sensor in sensors:
+        sensor.update()
+
+    assert [call[0] for call in hub.read_holding_registers.call_args_list] \
+        == [(None, 0, 6), (None, 0, 1), (None, 5, 1)]
+    assert [sensor.state for sensor in sensors] == ['1', '2']
+
+    for sensor in sensors:
+        sensor.update()
+
+    assert [sensor.state for sensor in sensors] == ['3', '4']
+    assert hub.read_holding_registers.call_args[0] == (None, 5, 1)
+
+
+def test_failed_read(hass):
+    """Test other failures leave the sensors unchanged and stay merged."""
+    hub = MagicMock()
+    hub.read_holding_registers.side_effect = [
+        _error(4), _response([1, 0, 0, 0, 0, 2]),
+    ]
+    sensors = _setup_sensors(hass, hub, [
+        {'name': 'first', 'register': 0},
+        {'name': 'second', 'register': 5},
+    ])
+
+    sensors[0].update()
+    assert sensors[0].state is None
+
+    for sensor in sensors:
+        sensor.update()
+
+    assert [sensor.state for sensor in sensors] == ['1', '2']
+    assert hub.read_holding_registers.call_count == 2
@@ -1,9 +1,11 @@
 """Test the Mythic Beasts DNS component."""
+from datetime import timedelta
 import logging
 import asynctest
 
 from homeassistant.setup import async_setup_component
 from homeassistant.components import mythicbeastsdns
+import homeassistant.util.dt as dt_util
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -68,3 +70,53 @@ async def test_update_fails_if_invalid_host(hass):
         }
     )
     assert not result
+
+
+def _stored_update(age):
+    """Return a stored last update for example.org that is age old."""
+    return {
+        'version': mythicbeastsdns.STORAGE_VERSION,
+        'key': mythicbeastsdns.STORAGE_KEY,
+        'data': {
+            'domain': 'example.org',
+            'host': 'hass',
+            'updated': (dt_util.utcnow() - age).isoformat(),
+        },
+    }
+
+
+async def test_update_skipped_after_recent_update(hass, hass_storage):
+    """Test no update is sent at setup when the entry is still fresh."""
+    hass_storage[mythicbeastsdns.STORAGE_KEY] = \
+        _stored_update(timedelta(minutes=1))
+    update = asynctest.CoroutineMock(return_value=True)
+    with asynctest.mock.patch('mbddns.update', new=update):
+        result = await async_setup_component(hass, mythicbeastsdns.DOMAIN, {
+            mythicbeastsdns.DOMAIN: {
+                'domain': 'example.org',
+                'password': 'correct',
+                'host': 'hass'
+            }
+        })
+    assert result
+    assert update.call_count == 0
+
+
+async def test_update_after_stale_update(hass, hass_storage):
+    """Test an update is sent at setup when the entry is stale."""
+    hass_storage[mythicbeastsdns.STORAGE_KEY] = \
+        _stored_update(timedelta(minutes=20))
+    update = asynctest.CoroutineMock(return_value=True)
+    with asynctest.mock.patch('mbddns.update', new=update):
+        result = await async_setup_component(hass, mythicbeastsdns.DOMAIN, {
+            mythicbeastsdns.DOMAIN: {
+                'domain': 'example.org',
+                'password': 'correct',
+                'host': 'hass'
+            }
+        })
+    assert result
+    assert update.call_count == 1
+    stored = hass_storage[mythicbeastsdns.STORAGE_KEY]['data']
+    assert dt_util.utcnow() - dt_util.parse_datetime(stored['updated']) < \
+        timedelta(minutes=1)
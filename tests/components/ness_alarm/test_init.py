@@ -152,6 +152,21 @@ async def test_dispatch_zone_change(hass, mock_nessclient):
     assert hass.states.is_state('binary_sensor.zone_2', 'off')
 
 
+async def test_dispatch_zone_change_burst(hass, mock_nessclient):
+    """Test zone changes reported together are all written."""
+    await async_setup_component(hass, DOMAIN, VALID_CONFIG)
+    await hass.async_block_till_done()
+
+    on_zone_change = mock_nessclient.on_zone_change.call_args[0][0]
+    on_zone_change(1, True)
+    on_zone_change(2, True)
+    on_zone_change(1, False)
+
+    await hass.async_block_till_done()
+    assert hass.states.is_state('binary_sensor.zone_1', 'off')
+    assert hass.states.is_state('binary_sensor.zone_2', 'on')
+
+
 async def test_arming_state_change(hass, mock_nessclient):
     """Test arming state change handing."""
     states = [
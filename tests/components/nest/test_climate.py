@@ -0,0 +1,88 @@
+"""The tests for the Nest climate platform."""
+import asyncio
+from unittest.mock import MagicMock, PropertyMock, patch
+
+from nest.nest import APIError
+import pytest
+
+from homeassistant.components.nest import climate as nest
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+
+
+@pytest.fixture
+def target():
+    """Mock the target temperature of a Nest device."""
+    return PropertyMock()
+
+
+@pytest.fixture
+def thermostat(hass, target):
+    """Return a heating thermostat added to hass."""
+    device = MagicMock()
+    type(device).target = target
+    entity = nest.NestThermostat(MagicMock(), device, 'C')
+    entity.hass = hass
+    entity.entity_id = 'climate.nest'
+    entity._mode = 'heat'
+    hass.loop.run_until_complete(entity.async_added_to_hass())
+    return entity
+
+
+async def _set_temperatures(hass, thermostat, *temperatures):
+    """Set target temperatures the way the climate service does."""
+    for temperature in temperatures:
+        await hass.async_add_executor_job(
+            lambda temp=temperature: thermostat.set_temperature(
+                temperature=temp))
+    await hass.async_block_till_done()
+
+
+async def test_set_temperature_burst(hass, thermostat, target):
+    """Test a burst of target changes writes only the last one."""
+    with patch.object(nest, 'TARGET_WRITE_DELAY', 0.05):
+        await _set_temperatures(hass, thermostat, 19, 20, 21)
+        assert not target.called
+
+        await asyncio.sleep(0.1)
+        await hass.async_block_till_done()
+
+    target.assert_called_once_with(21)
+
+
+async def test_flush_on_stop(hass, thermostat, target):
+    """Test a pending target is written when Home Assistant stops."""
+    await _set_temperatures(hass, thermostat, 21)
+    assert not target.called
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
+    await hass.async_block_till_done()
+
+    target.assert_called_once_with(21)
+
+
+async def test_flush_on_remove(hass, thermostat, target):
+    """Test a pending target is written when the thermostat is removed."""
+    await _set_temperatures(hass, thermostat, 21)
+    assert not target.called
+
+    await thermostat.async_will_remove_from_hass()
+
+    target.assert_called_once_with(21)
+
+    await asyncio.sleep(nest.TARGET_WRITE_DELAY + 0.1)
+    await hass.async_block_till_done()
+
+    target.assert_called_once_with(21)
+
+
+async def test_write_api_error(hass, thermostat, target):
+    """Test the state is restored when Nest refuses the target."""
+    target.side_effect = APIError(None)
+    thermostat.schedule_update_ha_state = MagicMock()
+    with patch.object(nest, 'TARGET_WRITE_DELAY', 0.05):
+        await _set_temperatures(hass, thermostat, 21)
+        await asyncio.sleep(0.1)
+        await hass.async_block_till_done()
+
+    target.assert_called_once_with(21)
+    thermostat.schedule_update_ha_state.assert_called_once_with(True)